@@ -34,11 +34,11 @@ if __name__ == '__main__':
     else:
         print(f"\\n========== COMMAND REGISTERS ===================================")
         print(f"get_fw_revision               : {um7.get_fw_revision}")
-        print(f"flash_commit                  : {um7.flash_commit}")
-        print(f"reset_to_factory              : {um7.reset_to_factory}")
-        print(f"zero_gyros                    : {um7.zero_gyros}")
-        print(f"set_home_position             : {um7.set_home_position}")
-        print(f"set_mag_reference             : {um7.set_mag_reference}")
-        print(f"calibrate_accelerometers      : {um7.calibrate_accelerometers}")
-        print(f"reset_ekf                     : {um7.reset_ekf}")
+        print(f"flash_commit                  : {um7.flash_commit()}")
+        print(f"reset_to_factory              : {um7.reset_to_factory()}")
+        print(f"zero_gyros                    : {um7.zero_gyros()}")
+        print(f"set_home_position             : {um7.set_home_position()}")
+        print(f"set_mag_reference             : {um7.set_mag_reference()}")
+        print(f"calibrate_accelerometers      : {um7.calibrate_accelerometers()}")
+        print(f"reset_ekf                     : {um7.reset_ekf()}")
 
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# Author: Dr. Konstantin Selyunin
+# License: MIT
+
+
+class RslException(Exception):
+    """
+    RSL Exception class for recording RedShiftLabs and/or UM7 specific errors
+    """
+    pass
+
+
+class RegisterReadError(RslException):
+    """
+    Raised when no valid response for a register read request is received from UM7
+    """
+    pass
@@ -17,11 +17,19 @@ if __name__ == '__main__':
     rsl_svd_generator = RslGenerator(svd_file=svd_file)
     um7_main_registers = indent(rsl_svd_generator.generate_props_for_main_register_map(), ' ' * 4)
     um7_hidden_registers = indent(rsl_svd_generator.generate_props_for_hidden_registers(), ' ' * 4)
+    um7_return_types = rsl_svd_generator.generate_return_types()
+    um7_structs = rsl_svd_generator.generate_struct_definitions()
+    um7_reg_enum = RslGenerator.generate_address_enum('Reg', rsl_svd_generator.regs)
+    um7_hidden_reg_enum = RslGenerator.generate_address_enum('HiddenReg', rsl_svd_generator.hidden_regs, 'HIDDEN_')
 
     today = datetime.now().strftime('%Y.%m.%d')
     params_dict = {
         'generated_code_for_main_register_map': um7_main_registers,
         'generated_code_for_hidden_register_map': um7_hidden_registers,
+        'generated_return_types': um7_return_types,
+        'generated_structs': um7_structs,
+        'generated_reg_enum': um7_reg_enum,
+        'generated_hidden_reg_enum': um7_hidden_reg_enum,
         'today': today
     }
     um7_template = os.path.join(os.path.dirname(__file__), 'templates/um7_template.jinja2')
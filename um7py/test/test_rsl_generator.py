@@ -141,3 +141,40 @@ def test_generated_code_for_combined(rsl_generator: RslGenerator):
     assert len(generated_code) > 0, f"No code has been generated for {register_name}"
     assert "not implemented" not in generated_code.lower(), "Not implemented should not be in generated code!"
 
+
+@pytest.mark.gen
+def test_interpret_bitfields_without_noop_operations(rsl_generator: RslGenerator):
+    reg = rsl_generator.find_register_by(name='DREG_HEALTH')
+    _, generated_code = rsl_generator.interpret_bitfields(reg)
+    assert "sats_used_val = reg.raw_value >> 26\n" in generated_code, "Mask for the most significant field is a no-op!"
+    assert "gps_val = reg.raw_value & 0x0001\n" in generated_code, "Shift for the least significant field is a no-op!"
+    assert "hdop_val = (reg.raw_value >> 16) & 0x03FF\n" in generated_code, "Incorrect code for HDOP bit field!"
+
+
+@pytest.mark.gen
+def test_create_return_type(rsl_generator: RslGenerator):
+    reg = rsl_generator.find_register_by(name='CREG_COM_RATES6')
+    return_type = rsl_generator.create_return_type(reg)
+    expected = "CregComRates6 = namedtuple('CregComRates6', 'reg pose_rate gyro_bias_rate health_rate')\n"
+    assert return_type == expected, f"INCORRECT return type for CREG_COM_RATES6, got {return_type}"
+    reg = rsl_generator.find_register_by(name='GET_FW_REVISION')
+    assert rsl_generator.create_return_type(reg) == '', "No return type is expected for a single return value!"
+
+
+@pytest.mark.gen
+def test_generate_struct_definitions(rsl_generator: RslGenerator):
+    struct_definitions = rsl_generator.generate_struct_definitions()
+    assert "_F32_STRUCT = struct.Struct('>f')\n" in struct_definitions, "No precompiled struct for float registers!"
+    assert struct_definitions.count('_F32_STRUCT =') == 1, "Precompiled structs are not unique!"
+    reg = rsl_generator.find_register_by(name='DREG_GYRO_RAW_XY')
+    _, generated_code = rsl_generator.interpret_packed_data(reg)
+    assert generated_code == "gyro_raw_x, gyro_raw_y = _I16_I16_STRUCT.unpack(payload)", "Struct is not precompiled!"
+
+
+@pytest.mark.gen
+def test_generate_address_enum(rsl_generator: RslGenerator):
+    enum_code = RslGenerator.generate_address_enum('HiddenReg', rsl_generator.hidden_regs, 'HIDDEN_')
+    assert enum_code.startswith("class HiddenReg(IntEnum):\n"), "Incorrect enum class declaration!"
+    assert "    GYRO_VARIANCE = 0x00\n" in enum_code, "Incorrect enum member for HIDDEN_GYRO_VARIANCE!"
+    enum_code = RslGenerator.generate_address_enum('Reg', rsl_generator.regs)
+    assert "    DREG_VELOCITY_NORTH = 0x79\n" in enum_code, "Incorrect enum member for DREG_VELOCITY_NORTH!"
@@ -0,0 +1,45 @@
+import pytest
+
+from um7py.rsl_spi import SpiCommunication
+
+
+class FakeSpi(SpiCommunication):
+    """
+    SPI transport which answers every transfer with register values equal to their addresses
+    """
+    def __init__(self):
+        super().__init__()
+        self.transfers = []
+
+    def xfer(self, msg):
+        self.transfers.append(msg)
+        num_registers = (len(msg) - 2) // 4
+        return msg[:2] + [byte for addr in range(msg[1], msg[1] + num_registers) for byte in (0, 0, 0, addr)]
+
+
+@pytest.fixture
+def spi() -> FakeSpi:
+    spi = FakeSpi()
+    spi.register_cache.ttl = 1.0
+    return spi
+
+
+def test_read_register_served_from_burst(spi: FakeSpi):
+    spi.read_consecutive_registers(0x00, 8)
+    assert spi.read_register(0x05) == bytes([0, 0, 0, 5]), "Incorrect cached register payload!"
+    assert len(spi.transfers) == 1, "Register read again although it is cached!"
+
+
+def test_write_register_invalidates_cache(spi: FakeSpi):
+    spi.read_register(0x05)
+    spi.write_register(0x05, 1)
+    spi.read_register(0x05)
+    assert len(spi.transfers) == 3, "Written register is served from cache!"
+
+
+def test_read_command_not_shared_between_transfers(spi: FakeSpi):
+    spi.read_register(0x01)
+    spi.transfers[0][2:] = [0xFF] * 4
+    spi.register_cache.invalidate()
+    spi.read_register(0x01)
+    assert spi.transfers[1] == [0x00, 0x01, 0x00, 0x00, 0x00, 0x00], "Incorrect SPI read command!"
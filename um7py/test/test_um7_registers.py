@@ -0,0 +1,165 @@
+import pytest
+import struct
+from typing import Union
+
+from um7py.um7_registers import UM7Registers
+
+
+class UM7RegistersStub(UM7Registers):
+    """
+    Register access object which answers reads from an in-memory register map instead of the sensor
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.register_map = {}
+
+    def connect(self, *args, **kwargs):
+        pass
+
+    def read_register(self, reg_addr: int, **kw) -> memoryview:
+        return memoryview(self.register_map.get(reg_addr, bytes(4)))
+
+    def read_consecutive_registers(self, reg_addr: int, num_registers: int, **kw) -> memoryview:
+        payload = b''.join(self.register_map.get(addr, bytes(4)) for addr in range(reg_addr, reg_addr + num_registers))
+        return memoryview(payload)
+
+    def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], **kw):
+        self.register_map[reg_addr] = reg_value
+        return True
+
+    def write_consecutive_registers(self, reg_addr: int, payload: bytes, **kw):
+        for idx in range(0, len(payload), 4):
+            self.register_map[reg_addr + idx // 4] = payload[idx:idx + 4]
+        return True
+
+
+@pytest.fixture
+def um7_registers() -> UM7RegistersStub:
+    return UM7RegistersStub()
+
+
+def test_getter_unpacks_memoryview_payload(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x56] = struct.pack('>hh', -5, 7)
+    reg, gyro_raw_x, gyro_raw_y = um7_registers.dreg_gyro_raw_xy
+    assert (gyro_raw_x, gyro_raw_y) == (-5, 7), "Incorrect values decoded for DREG_GYRO_RAW_XY!"
+    assert reg.raw_value == 0xFFFB0007, "Incorrect raw value stored for DREG_GYRO_RAW_XY!"
+
+
+def test_getter_decodes_fw_revision(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0xAA] = b'U7B1'
+    assert um7_registers.get_fw_revision == 'U7B1', "Incorrect firmware revision decoded!"
+
+
+def test_read_attitude(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x6D] = struct.pack('>hh', 29789, 0)
+    um7_registers.register_map[0x6F] = struct.pack('>f', 1.5)
+    um7_registers.register_map[0x70] = struct.pack('>hh', 9102, -9102)
+    um7_registers.register_map[0x72] = struct.pack('>hh', 16, 32)
+    um7_registers.register_map[0x73] = struct.pack('>hxx', -48)
+    um7_registers.register_map[0x74] = struct.pack('>f', 2.5)
+    quaternion, euler = um7_registers.read_attitude()
+    assert quaternion.q_w == pytest.approx(1.0, abs=1e-4), "Incorrect quaternion scaling!"
+    assert quaternion.q_time == 1.5, "Incorrect quaternion time!"
+    assert (euler.roll, euler.pitch) == pytest.approx((100.0, -100.0), abs=1e-2), "Incorrect Euler angles scaling!"
+    assert (euler.roll_rate, euler.pitch_rate, euler.yaw_rate) == (1.0, 2.0, -3.0), "Incorrect Euler rates scaling!"
+    assert euler.time_stamp == 2.5, "Incorrect Euler time!"
+
+
+def test_getter_resolves_hidden_register(um7_registers: UM7RegistersStub):
+    reg, *_ = um7_registers.hidden_gyro_variance
+    assert reg.name == 'HIDDEN_GYRO_VARIANCE', "Hidden register is not resolved by the getter!"
+
+
+def test_read_sensor_frame(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x59] = struct.pack('>hh', 100, -200)
+    um7_registers.register_map[0x5F] = struct.pack('>f', 25.5)
+    um7_registers.register_map[0x6C] = struct.pack('>f', 3.25)
+    raw, proc = um7_registers.read_sensor_frame()
+    assert (raw.accel_raw_x, raw.accel_raw_y) == (100, -200), "Incorrect raw accelerometer data decoded!"
+    assert raw.temperature == 25.5, "Incorrect temperature decoded!"
+    assert proc.mag_proc_time == 3.25, "Incorrect processed magnetometer time decoded!"
+
+
+def test_getter_returns_named_fields(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x55] = bytes([0x0C, 0x0A, 0x20, 0x00])
+    health = um7_registers.dreg_health
+    assert health.sats_used == 3, "Incorrect SATS_USED decoded!"
+    assert health.hdop == 10, "Incorrect HDOP decoded!"
+    assert health.sats_in_view == 8, "Incorrect SATS_IN_VIEW decoded!"
+
+
+def test_accel_cal_matrix(um7_registers: UM7RegistersStub):
+    matrix = ((1.0, 0.5, 0.0), (0.0, 2.0, 0.0), (-0.5, 0.0, 4.0))
+    um7_registers.accel_cal_matrix = matrix
+    assert um7_registers.register_map[0x1C] == struct.pack('>f', 0.5), "Matrix is not written row by row!"
+    assert um7_registers.accel_cal_matrix == matrix, "Incorrect accelerometer calibration matrix read!"
+
+
+def test_accel_bias(um7_registers: UM7RegistersStub):
+    um7_registers.accel_bias = (0.25, -1.0, 3.5)
+    assert um7_registers.register_map[0x26] == struct.pack('>f', 3.5), "Bias vector is not written in x, y, z order!"
+    assert um7_registers.accel_bias == (0.25, -1.0, 3.5), "Incorrect accelerometer bias read!"
+
+
+def test_getter_looks_up_enumerated_values(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x00] = bytes([0x51, 0x00, 0x01, 0x00])
+    settings = um7_registers.creg_com_settings
+    baud_rate_field = settings.reg.find_field_by(name='BAUD_RATE')
+    assert settings.baud_rate is baud_rate_field.find_enum_entry_by(value=5), "Incorrect BAUD_RATE enum entry!"
+    assert settings.gps is settings.reg.find_field_by(name='GPS').find_enum_entry_by(value=1), "Incorrect GPS entry!"
+
+
+def test_stream_raw_imu(um7_registers: UM7RegistersStub):
+    um7_registers.register_map.update({0x56: struct.pack('>hh', 1, -2), 0x57: struct.pack('>hxx', 3),
+                                       0x59: struct.pack('>hh', 4, 5), 0x5A: struct.pack('>hxx', -6),
+                                       0x5C: struct.pack('>hh', 7, 8), 0x5D: struct.pack('>hxx', 9)})
+    samples = um7_registers.stream_raw_imu(2)
+    assert samples.typecode == 'h' and len(samples) == 18, "Incorrect number of raw samples!"
+    assert list(samples[9:]) == [1, -2, 3, 4, 5, -6, 7, 8, 9], "Incorrect raw sensor data decoded!"
+
+
+def test_getter_decodes_upper_int16(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x57] = struct.pack('>hxx', -1234)
+    assert um7_registers.dreg_gyro_raw_z.gyro_raw_z == -1234, "Incorrect value decoded for DREG_GYRO_RAW_Z!"
+
+
+def test_getter_returns_scalar_float(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x79] = struct.pack('>f', 1.5)
+    assert um7_registers.dreg_velocity_north.velocity_north == 1.5, "Float register is not decoded to a scalar!"
+
+
+def test_read_gps_blocks(um7_registers: UM7RegistersStub):
+    um7_registers.register_map.update({addr: struct.pack('>f', addr) for addr in range(0x75, 0x83)})
+    um7_registers.register_map.update({0x83: bytes([1, 40, 2, 35]), 0x88: bytes([11, 20, 12, 0])})
+    assert um7_registers.read_pose().position_time == 0x78, "Incorrect position time read!"
+    assert um7_registers.read_velocity().velocity_north == 0x79, "Incorrect north velocity read!"
+    assert um7_registers.read_gps().gps_time == 0x82, "Incorrect GPS time read!"
+    pose, velocity, gps = um7_registers.read_nav_state()
+    assert (pose.position_time, velocity.velocity_time, gps.gps_time) == (0x78, 0x7C, 0x82), "Incorrect state read!"
+    sats = um7_registers.read_gps_satellites()
+    assert sats.ids[1] == 2 and sats.snrs[1] == 35, "Incorrect satellite ids and SNRs read!"
+    assert sats.ids[11] == 12 and sats.snrs[11] == 0, "Incorrect satellite ids and SNRs read!"
+
+
+def test_getter_decodes_uint8_fields(um7_registers: UM7RegistersStub):
+    um7_registers.register_map[0x84] = bytes([3, 41, 4, 255])
+    sat = um7_registers.dreg_gps_sat_3_4
+    assert (sat.sat_3_id, sat.sat_3_snr, sat.sat_4_id, sat.sat_4_snr) == (3, 41, 4, 255), "Incorrect satellite data!"
+
+
+def test_read_float_registers(um7_registers: UM7RegistersStub):
+    um7_registers.register_map.update({addr: struct.pack('>f', addr / 2) for addr in range(0x61, 0x6D)})
+    values = um7_registers.read_float_registers(0x61, 12)
+    assert values == tuple(addr / 2 for addr in range(0x61, 0x6D)), "Incorrect float register block decoded!"
+
+
+def test_command_register_is_method(um7_registers: UM7RegistersStub):
+    assert um7_registers.zero_gyros() is True, "Command acknowledgement not returned!"
+    assert um7_registers.register_map[0xAD] == 1, "Command register not written!"
+
+
+def test_read_creg_com_block(um7_registers: UM7RegistersStub):
+    um7_registers.register_map.update({addr: int.to_bytes(addr + 1, 4, 'big') for addr in range(0x00, 0x08)})
+    creg_com = um7_registers.read_creg_com_block()
+    assert creg_com == tuple(range(1, 9)), "Incorrect communication registers read!"
+    assert creg_com.rates7 == 8, "Incorrect CREG_COM_RATES7 field!"
@@ -0,0 +1,239 @@
+import asyncio
+import pytest
+import struct
+import time
+
+from um7py.rsl_register_cache import RegisterCache
+from um7py.um7_registers import UM7Registers
+from um7py.um7_serial import UM7Serial, RegisterReadError
+
+
+class FakeUM7Port:
+    """
+    Serial port which answers UM7 read requests from an in-memory register map, every reply is followed by a
+    health broadcast packet, as it happens on the sensor with broadcasts enabled
+    """
+    def __init__(self, register_map: dict):
+        self.register_map = register_map
+        self.rx = bytearray()
+        self.written = []
+
+    @staticmethod
+    def packet(packet_type: int, address: int, payload: bytes = bytes()) -> bytes:
+        partial_packet = b'snp' + bytes([packet_type, address]) + payload
+        return partial_packet + int.to_bytes(sum(partial_packet), length=2, byteorder='big')
+
+    def write(self, data: bytes) -> int:
+        self.written.append(bytes(data))
+        idx = data.find(b'snp')
+        while idx != -1:
+            packet_type, address = data[idx + 3], data[idx + 4]
+            num_registers = (packet_type >> 2) & 0x0F if packet_type & 0x40 else 1
+            payload = b''.join(self.register_map.get(addr, bytes(4)) for addr in range(address, address + num_registers))
+            # reply has data, batch / length / hidden bits are the same as in request
+            self.rx += self.packet(0x80 | (packet_type & 0x7E), address, payload)
+            idx = data.find(b'snp', idx + 3)
+        self.rx += self.packet(0x80, 0x55, bytes(4))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+    def reset_input_buffer(self):
+        self.rx.clear()
+
+
+@pytest.fixture
+def um7_serial() -> UM7Serial:
+    um7 = UM7Serial.__new__(UM7Serial)
+    um7.port = FakeUM7Port({})
+    um7.buffer = bytearray()
+    um7.buffer_size = 125
+    um7.read_packets = {}
+    um7.write_headers = {}
+    um7.init_packet_templates()
+    um7.register_cache = RegisterCache()
+    um7.async_lock = None
+    return um7
+
+
+def test_compute_checksum(um7_serial: UM7Serial):
+    packet = FakeUM7Port.packet(0x80, 0x55, bytes([1, 2, 3, 4]))
+    assert um7_serial.compute_checksum(packet[:-2]) == packet[-2:], "Incorrect checksum computed!"
+    assert um7_serial.verify_checksum(packet), "Checksum of a valid packet is not verified!"
+
+
+def test_read_many_coalesces_adjacent_registers(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({0x79: struct.pack('>f', 1.0), 0x7A: struct.pack('>f', 2.0),
+                                         0x7B: struct.pack('>f', 3.0), 0x55: bytes([0, 0, 0, 7])})
+    registers = um7_serial.read_many([0x7B, 0x55, 0x79, 0x7A])
+    assert len(um7_serial.port.written[0]) == 14, "Adjacent registers are not coalesced into one batch request!"
+    assert struct.unpack('>f', registers[0x7A])[0] == 2.0, "Incorrect register payload in batch response!"
+    assert struct.unpack('>f', registers[0x7B])[0] == 3.0, "Incorrect register payload in batch response!"
+    assert registers[0x55].tobytes() == bytes([0, 0, 0, 7]), "Incorrect payload for single register response!"
+
+
+def test_read_many_sends_all_batches_at_once(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({addr: struct.pack('>f', addr) for addr in range(0x60, 0x60 + 42)})
+    registers = um7_serial.read_many(list(range(0x60, 0x60 + 42)))
+    assert len(um7_serial.port.written) == 1, "Requests are re-sent although all responses were received!"
+    assert len(registers) == 42, "Not all registers are read!"
+    assert struct.unpack('>f', registers[0x60 + 41])[0] == 0x60 + 41, "Incorrect register payload in batch response!"
+
+
+def test_read_many_async(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({0x79: struct.pack('>f', 1.0), 0x7C: struct.pack('>f', 4.0)})
+    um7_serial.register_cache.ttl = 1.0
+    registers = asyncio.run(um7_serial.read_many_async([0x79, 0x7A, 0x7B, 0x7C]))
+    assert len(um7_serial.port.written) == 1, "Registers are not requested in one write!"
+    assert struct.unpack('>f', registers[0x7C])[0] == 4.0, "Incorrect register payload in async read!"
+    assert um7_serial.read_register(0x79).tobytes() == struct.pack('>f', 1.0), "Incorrect cached register payload!"
+    assert len(um7_serial.port.written) == 1, "Async read does not seed the register cache!"
+
+
+def test_gathered_async_reads(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({addr: struct.pack('>f', addr) for addr in range(0x60, 0x70)})
+    write = um7_serial.port.write
+    port_users = []
+
+    def slow_write(data: bytes) -> int:
+        # a second read using the port while the first one waits for its reply would be recorded here
+        port_users.append(data)
+        time.sleep(0.01)
+        written = write(data)
+        port_users.remove(data)
+        assert len(port_users) == 0, "Port is used by concurrent reads!"
+        return written
+    um7_serial.port.write = slow_write
+
+    async def read_all():
+        return await asyncio.gather(um7_serial.read_many_async(list(range(0x60, 0x68))),
+                                    um7_serial.read_register_async(0x6A),
+                                    um7_serial.read_many_async(list(range(0x68, 0x70))))
+    first_block, single, second_block = asyncio.run(read_all())
+    assert struct.unpack('>f', first_block[0x67])[0] == 0x67, "Incorrect register payload in gathered read!"
+    assert struct.unpack('>f', single)[0] == 0x6A, "Incorrect register payload in gathered read!"
+    assert struct.unpack('>f', second_block[0x6F])[0] == 0x6F, "Incorrect register payload in gathered read!"
+
+
+def test_read_many_raises_without_response(um7_serial: UM7Serial):
+    um7_serial.port.write = lambda data: len(data)
+    with pytest.raises(RegisterReadError):
+        um7_serial.read_many([0x79, 0x7A])
+
+
+def test_read_register_raises_without_response(um7_serial: UM7Serial):
+    um7_serial.port.write = lambda data: len(data)
+    with pytest.raises(RegisterReadError):
+        um7_serial.read_register(0x55)
+    ok, payload = um7_serial.try_read_register(0x55)
+    assert not ok and len(payload) == 0, "Failed register read is not reported!"
+
+
+def test_read_register_without_following_packet(um7_serial: UM7Serial):
+    def reply_only(data: bytes) -> int:
+        um7_serial.port.rx += FakeUM7Port.packet(0x80, data[4], bytes([0, 0, 0, 7]))
+        return len(data)
+    um7_serial.port.write = reply_only
+    assert um7_serial.read_register(0x55).tobytes() == bytes([0, 0, 0, 7]), "Last reply in buffer is not found!"
+
+
+def test_read_register_raises_on_error_reply(um7_serial: UM7Serial):
+    def reply_with_error(data: bytes) -> int:
+        um7_serial.port.rx += FakeUM7Port.packet(0x01, data[4])
+        return len(data)
+    um7_serial.port.write = reply_with_error
+    with pytest.raises(RegisterReadError):
+        um7_serial.read_register(0x79)
+
+
+def test_read_register_served_from_batch_cache(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({0x79: struct.pack('>f', 1.0), 0x7A: struct.pack('>f', 2.0)})
+    um7_serial.read_consecutive_registers(0x79, 2)
+    assert struct.unpack('>f', um7_serial.read_register(0x7A))[0] == 2.0, "Incorrect cached register payload!"
+    assert len(um7_serial.port.written) == 1, "Register read again although it is cached!"
+    um7_serial.write_register(0x7A, 3.0)
+    um7_serial.read_register(0x7A)
+    assert len(um7_serial.port.written) == 3, "Written register is served from cache!"
+
+
+def test_write_register_uses_precomputed_header(um7_serial: UM7Serial):
+    um7_serial.write_register(0x24, 1.5)
+    expected_packet = um7_serial.construct_packet(um7_serial.construct_packet_type(has_data=True), 0x24,
+                                                  struct.pack('>f', 1.5))
+    assert um7_serial.port.written[0] == expected_packet, "Incorrect write packet sent!"
+
+
+def test_recv_broadcast_decodes_packets(um7_serial: UM7Serial):
+    UM7Registers.__init__(um7_serial)
+    euler_payload = struct.pack('>hhhxxhhhxxf', 910, -910, 1820, 16, 32, -16, 1.5)
+    corrupted_packet = FakeUM7Port.packet(0x80, 0x55, bytes([0, 0, 2, 0]))[:-1] + b'\x00'
+    um7_serial.port.rx += corrupted_packet + FakeUM7Port.packet(0x80, 0x55, bytes([0, 0, 1, 0])) + \
+        FakeUM7Port.packet(0xD4, 0x70, euler_payload) + FakeUM7Port.packet(0x80, 0x55, bytes(4))
+    broadcast = um7_serial.recv_broadcast(num_packets=2)
+    assert next(broadcast).health == 0x100, "Incorrect health broadcast decoded!"
+    euler = next(broadcast)
+    assert round(euler.roll, 3) == 9.998 and euler.time_stamp == 1.5, "Incorrect Euler broadcast decoded!"
+    assert euler.roll_rate == 1.0 and euler.yaw_rate == -1.0, "Incorrect Euler rates decoded!"
+
+
+def test_decode_quaternion_broadcast(um7_serial: UM7Serial):
+    packet = FakeUM7Port.packet(0xCC, 0x6D, struct.pack('>hhhhf', 29789, 0, -14895, 0, 2.5))
+    quaternion = um7_serial.decode_quaternion_broadcast(packet)
+    assert round(quaternion.q_w, 4) == 1.0 and quaternion.q_time == 2.5, "Incorrect quaternion decoded!"
+    assert round(quaternion.q_y, 2) == -0.5, "Incorrect quaternion decoded!"
+
+
+def test_recv_broadcast_packet_keeps_last_packet(um7_serial: UM7Serial):
+    UM7Registers.__init__(um7_serial)
+    um7_serial.port.rx += FakeUM7Port.packet(0x80, 0x55, bytes([0, 0, 1, 0])) + FakeUM7Port.packet(0x80, 0x55, bytes(4))
+    health = next(um7_serial.recv_health_broadcast(num_packets=1))
+    assert health.health == 0x100, "Incorrect health broadcast decoded!"
+    assert um7_serial.buffer == FakeUM7Port.packet(0x80, 0x55, bytes(4)), "Last packet is not kept in the buffer!"
+
+
+def test_valid_data_packet_types_match_check_packet(um7_serial: UM7Serial):
+    for packet_length in (11, 19, 23, 27, 51, 55):
+        valid_packet_types = um7_serial.valid_data_packet_types(packet_length)
+        for packet_type in range(0x80, 0x100):
+            packet = FakeUM7Port.packet(packet_type, 0x55, bytes(packet_length - 7))
+            assert (packet_type in valid_packet_types) == um7_serial.check_packet(packet), \
+                f"Packet type {packet_type:#04x} validated differently for length {packet_length}!"
+
+
+def test_write_register_encodes_value_types(um7_serial: UM7Serial):
+    um7_serial.write_register(0x24, True)
+    um7_serial.write_register(0x24, bytearray([0, 0, 0, 2]))
+    assert um7_serial.port.written[0][5:9] == bytes([0, 0, 0, 1]), "Incorrect payload for bool value!"
+    assert um7_serial.port.written[1][5:9] == bytes([0, 0, 0, 2]), "Incorrect payload for bytearray value!"
+
+
+def test_get_packet_type_round_trip(um7_serial: UM7Serial):
+    packet_type = um7_serial.construct_packet_type(has_data=True, is_batch=True, data_length=9, hidden=True)
+    assert um7_serial.get_packet_type(packet_type) == (True, True, 9, True, False), "Incorrect packet type decoded!"
+
+
+def test_read_register_reply_in_pieces(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({0x79: struct.pack('>f', 1.0)})
+    read_all = um7_serial.port.read
+    # the reply trickles in, at most 3 bytes are available per read
+    um7_serial.port.read = lambda size=1: read_all(min(size, 3))
+    assert um7_serial.read_register(0x79).tobytes() == struct.pack('>f', 1.0), "Incorrect register payload!"
+    assert len(um7_serial.port.written) == 1, "Request is re-sent while the reply is still being received!"
+
+
+def test_cached_payload_is_read_only(um7_serial: UM7Serial):
+    um7_serial.port.register_map.update({0x79: struct.pack('>f', 1.0), 0x7A: struct.pack('>f', 2.0)})
+    um7_serial.register_cache.ttl = 1.0
+    assert um7_serial.read_register(0x79).readonly, "Register payload can be modified!"
+    assert um7_serial.read_many([0x7A])[0x7A].readonly, "Register payload can be modified!"
+    assert um7_serial.register_cache.get(0x79).readonly, "Cached register payload can be modified!"
@@ -191,6 +191,16 @@ class UM7VelocityPacket:
     velocity_time: float
 
 
+@dataclass
+class UM7GpsPacket:
+    latitude: float
+    longitude: float
+    altitude: float
+    course: float
+    speed: float
+    gps_time: float
+
+
 @dataclass
 class UM7GyroBiasPacket:
     gyro_bias_x: float
@@ -9,15 +9,291 @@ import os.path
 import struct
 
 from abc import abstractmethod, ABC
+from array import array
+from collections import namedtuple
+from enum import IntEnum
 from typing import Union, Tuple
 
+from um7py.rsl_exceptions import RegisterReadError
 from um7py.rsl_xml_svd.rsl_svd_parser import RslSvdParser
+from um7py.um7_broadcast_packets import UM7AllProcPacket, UM7AllRawPacket, UM7EulerPacket, UM7QuaternionPacket, \
+    UM7PosePacket, UM7VelocityPacket, UM7GpsPacket
+
+CregComSettings = namedtuple('CregComSettings', 'reg baud_rate gps_baud gps sat')
+CregComRates1 = namedtuple('CregComRates1', 'reg raw_accel_rate raw_gyro_rate raw_mag_rate')
+CregComRates2 = namedtuple('CregComRates2', 'reg temp_rate all_raw_rate')
+CregComRates3 = namedtuple('CregComRates3', 'reg proc_accel_rate proc_gyro_rate proc_mag_rate')
+CregComRates4 = namedtuple('CregComRates4', 'reg all_proc_rate')
+CregComRates5 = namedtuple('CregComRates5', 'reg quat_rate euler_rate position_rate velocity_rate')
+CregComRates6 = namedtuple('CregComRates6', 'reg pose_rate gyro_bias_rate health_rate')
+CregComRates7 = namedtuple('CregComRates7', 'reg nmea_health_rate nmea_pose_rate nmea_attitude_rate nmea_sensor_rate nmea_rates_rate nmea_gps_pose_rate nmea_quat_rate')
+CregMiscSettings = namedtuple('CregMiscSettings', 'reg pps zg q mag')
+CregHomeNorth = namedtuple('CregHomeNorth', 'reg set_home_north')
+CregHomeEast = namedtuple('CregHomeEast', 'reg set_home_east')
+CregHomeUp = namedtuple('CregHomeUp', 'reg set_home_up')
+CregGyroTrimX = namedtuple('CregGyroTrimX', 'reg gyro_trim_x')
+CregGyroTrimY = namedtuple('CregGyroTrimY', 'reg gyro_trim_y')
+CregGyroTrimZ = namedtuple('CregGyroTrimZ', 'reg gyro_trim_z')
+CregMagCal11 = namedtuple('CregMagCal11', 'reg mag_cal1_1')
+CregMagCal12 = namedtuple('CregMagCal12', 'reg mag_cal1_2')
+CregMagCal13 = namedtuple('CregMagCal13', 'reg mag_cal1_3')
+CregMagCal21 = namedtuple('CregMagCal21', 'reg mag_cal2_1')
+CregMagCal22 = namedtuple('CregMagCal22', 'reg mag_cal2_2')
+CregMagCal23 = namedtuple('CregMagCal23', 'reg mag_cal2_3')
+CregMagCal31 = namedtuple('CregMagCal31', 'reg mag_cal3_1')
+CregMagCal32 = namedtuple('CregMagCal32', 'reg mag_cal3_2')
+CregMagCal33 = namedtuple('CregMagCal33', 'reg mag_cal3_3')
+CregMagBiasX = namedtuple('CregMagBiasX', 'reg mag_bias_x')
+CregMagBiasY = namedtuple('CregMagBiasY', 'reg mag_bias_y')
+CregMagBiasZ = namedtuple('CregMagBiasZ', 'reg mag_bias_z')
+CregAccelCal11 = namedtuple('CregAccelCal11', 'reg accel_cal1_1')
+CregAccelCal12 = namedtuple('CregAccelCal12', 'reg accel_cal1_2')
+CregAccelCal13 = namedtuple('CregAccelCal13', 'reg accel_cal1_3')
+CregAccelCal21 = namedtuple('CregAccelCal21', 'reg accel_cal2_1')
+CregAccelCal22 = namedtuple('CregAccelCal22', 'reg accel_cal2_2')
+CregAccelCal23 = namedtuple('CregAccelCal23', 'reg accel_cal2_3')
+CregAccelCal31 = namedtuple('CregAccelCal31', 'reg accel_cal3_1')
+CregAccelCal32 = namedtuple('CregAccelCal32', 'reg accel_cal3_2')
+CregAccelCal33 = namedtuple('CregAccelCal33', 'reg accel_cal3_3')
+CregAccelBiasX = namedtuple('CregAccelBiasX', 'reg accel_bias_x')
+CregAccelBiasY = namedtuple('CregAccelBiasY', 'reg accel_bias_y')
+CregAccelBiasZ = namedtuple('CregAccelBiasZ', 'reg accel_bias_z')
+DregHealth = namedtuple('DregHealth', 'reg sats_used hdop sats_in_view ovf mg_n acc_n accel gyro mag gps')
+DregGyroRawXy = namedtuple('DregGyroRawXy', 'reg gyro_raw_x gyro_raw_y')
+DregGyroRawZ = namedtuple('DregGyroRawZ', 'reg gyro_raw_z')
+DregGyroRawTime = namedtuple('DregGyroRawTime', 'reg gyro_raw_time')
+DregAccelRawXy = namedtuple('DregAccelRawXy', 'reg accel_raw_x accel_raw_y')
+DregAccelRawZ = namedtuple('DregAccelRawZ', 'reg accel_raw_z')
+DregAccelRawTime = namedtuple('DregAccelRawTime', 'reg accel_raw_time')
+DregMagRawXy = namedtuple('DregMagRawXy', 'reg mag_raw_x mag_raw_y')
+DregMagRawZ = namedtuple('DregMagRawZ', 'reg mag_raw_z')
+DregMagRawTime = namedtuple('DregMagRawTime', 'reg mag_raw_time')
+DregTemperature = namedtuple('DregTemperature', 'reg temperature')
+DregTemperatureTime = namedtuple('DregTemperatureTime', 'reg temperature_time')
+DregGyroProcX = namedtuple('DregGyroProcX', 'reg gyro_proc_x')
+DregGyroProcY = namedtuple('DregGyroProcY', 'reg gyro_proc_y')
+DregGyroProcZ = namedtuple('DregGyroProcZ', 'reg gyro_proc_z')
+DregGyroProcTime = namedtuple('DregGyroProcTime', 'reg gyro_proc_time')
+DregAccelProcX = namedtuple('DregAccelProcX', 'reg accel_proc_x')
+DregAccelProcY = namedtuple('DregAccelProcY', 'reg accel_proc_y')
+DregAccelProcZ = namedtuple('DregAccelProcZ', 'reg accel_proc_z')
+DregAccelProcTime = namedtuple('DregAccelProcTime', 'reg accel_proc_time')
+DregMagProcX = namedtuple('DregMagProcX', 'reg mag_proc_x')
+DregMagProcY = namedtuple('DregMagProcY', 'reg mag_proc_y')
+DregMagProcZ = namedtuple('DregMagProcZ', 'reg mag_proc_z')
+DregMagProcTime = namedtuple('DregMagProcTime', 'reg mag_proc_time')
+DregQuatAb = namedtuple('DregQuatAb', 'reg quat_a quat_b')
+DregQuatCd = namedtuple('DregQuatCd', 'reg quat_c quat_d')
+DregQuatTime = namedtuple('DregQuatTime', 'reg quat_time')
+DregEulerPhiTheta = namedtuple('DregEulerPhiTheta', 'reg phi theta')
+DregEulerPsi = namedtuple('DregEulerPsi', 'reg psi')
+DregEulerPhiThetaDot = namedtuple('DregEulerPhiThetaDot', 'reg phi_dot theta_dot')
+DregEulerPsiDot = namedtuple('DregEulerPsiDot', 'reg psi_dot')
+DregEulerTime = namedtuple('DregEulerTime', 'reg euler_time')
+DregPositionNorth = namedtuple('DregPositionNorth', 'reg position_north')
+DregPositionEast = namedtuple('DregPositionEast', 'reg position_east')
+DregPositionUp = namedtuple('DregPositionUp', 'reg position_up')
+DregPositionTime = namedtuple('DregPositionTime', 'reg position_time')
+DregVelocityNorth = namedtuple('DregVelocityNorth', 'reg velocity_north')
+DregVelocityEast = namedtuple('DregVelocityEast', 'reg velocity_east')
+DregVelocityUp = namedtuple('DregVelocityUp', 'reg velocity_up')
+DregVelocityTime = namedtuple('DregVelocityTime', 'reg velocity_time')
+DregGpsLatitude = namedtuple('DregGpsLatitude', 'reg gps_latitude')
+DregGpsLongitude = namedtuple('DregGpsLongitude', 'reg gps_longitude')
+DregGpsAltitude = namedtuple('DregGpsAltitude', 'reg gps_altitude')
+DregGpsCourse = namedtuple('DregGpsCourse', 'reg gps_course')
+DregGpsSpeed = namedtuple('DregGpsSpeed', 'reg gps_speed')
+DregGpsTime = namedtuple('DregGpsTime', 'reg gps_time')
+DregGpsSat12 = namedtuple('DregGpsSat12', 'reg sat_1_id sat_1_snr sat_2_id sat_2_snr')
+DregGpsSat34 = namedtuple('DregGpsSat34', 'reg sat_3_id sat_3_snr sat_4_id sat_4_snr')
+DregGpsSat56 = namedtuple('DregGpsSat56', 'reg sat_5_id sat_5_snr sat_6_id sat_6_snr')
+DregGpsSat78 = namedtuple('DregGpsSat78', 'reg sat_7_id sat_7_snr sat_8_id sat_8_snr')
+DregGpsSat910 = namedtuple('DregGpsSat910', 'reg sat_9_id sat_9_snr sat_10_id sat_10_snr')
+DregGpsSat1112 = namedtuple('DregGpsSat1112', 'reg sat_11_id sat_11_snr sat_12_id sat_12_snr')
+DregGyroBiasX = namedtuple('DregGyroBiasX', 'reg gyro_bias_x')
+DregGyroBiasY = namedtuple('DregGyroBiasY', 'reg gyro_bias_y')
+DregGyroBiasZ = namedtuple('DregGyroBiasZ', 'reg gyro_bias_z')
+HiddenGyroVariance = namedtuple('HiddenGyroVariance', 'reg gyro_variance')
+HiddenAccelVariance = namedtuple('HiddenAccelVariance', 'reg accel_variance')
+
+# structs shared by all generated register getters with the same payload layout
+_U8_U8_U8_PAD_STRUCT = struct.Struct('>BBBx')
+_U8_PAD_U8_PAD_STRUCT = struct.Struct('>BxBx')
+_U8_PAD_PAD_U8_STRUCT = struct.Struct('>BxxB')
+_F32_STRUCT = struct.Struct('>f')
+_I16_STRUCT = struct.Struct('>h')
+_I16_I16_STRUCT = struct.Struct('>hh')
+_PAD_PAD_PAD_U8_STRUCT = struct.Struct('>xxxB')
+
+
+class Reg(IntEnum):
+    CREG_COM_SETTINGS = 0x00
+    CREG_COM_RATES1 = 0x01
+    CREG_COM_RATES2 = 0x02
+    CREG_COM_RATES3 = 0x03
+    CREG_COM_RATES4 = 0x04
+    CREG_COM_RATES5 = 0x05
+    CREG_COM_RATES6 = 0x06
+    CREG_COM_RATES7 = 0x07
+    CREG_MISC_SETTINGS = 0x08
+    CREG_HOME_NORTH = 0x09
+    CREG_HOME_EAST = 0x0A
+    CREG_HOME_UP = 0x0B
+    CREG_GYRO_TRIM_X = 0x0C
+    CREG_GYRO_TRIM_Y = 0x0D
+    CREG_GYRO_TRIM_Z = 0x0E
+    CREG_MAG_CAL1_1 = 0x0F
+    CREG_MAG_CAL1_2 = 0x10
+    CREG_MAG_CAL1_3 = 0x11
+    CREG_MAG_CAL2_1 = 0x12
+    CREG_MAG_CAL2_2 = 0x13
+    CREG_MAG_CAL2_3 = 0x14
+    CREG_MAG_CAL3_1 = 0x15
+    CREG_MAG_CAL3_2 = 0x16
+    CREG_MAG_CAL3_3 = 0x17
+    CREG_MAG_BIAS_X = 0x18
+    CREG_MAG_BIAS_Y = 0x19
+    CREG_MAG_BIAS_Z = 0x1A
+    CREG_ACCEL_CAL1_1 = 0x1B
+    CREG_ACCEL_CAL1_2 = 0x1C
+    CREG_ACCEL_CAL1_3 = 0x1D
+    CREG_ACCEL_CAL2_1 = 0x1E
+    CREG_ACCEL_CAL2_2 = 0x1F
+    CREG_ACCEL_CAL2_3 = 0x20
+    CREG_ACCEL_CAL3_1 = 0x21
+    CREG_ACCEL_CAL3_2 = 0x22
+    CREG_ACCEL_CAL3_3 = 0x23
+    CREG_ACCEL_BIAS_X = 0x24
+    CREG_ACCEL_BIAS_Y = 0x25
+    CREG_ACCEL_BIAS_Z = 0x26
+    DREG_HEALTH = 0x55
+    DREG_GYRO_RAW_XY = 0x56
+    DREG_GYRO_RAW_Z = 0x57
+    DREG_GYRO_RAW_TIME = 0x58
+    DREG_ACCEL_RAW_XY = 0x59
+    DREG_ACCEL_RAW_Z = 0x5A
+    DREG_ACCEL_RAW_TIME = 0x5B
+    DREG_MAG_RAW_XY = 0x5C
+    DREG_MAG_RAW_Z = 0x5D
+    DREG_MAG_RAW_TIME = 0x5E
+    DREG_TEMPERATURE = 0x5F
+    DREG_TEMPERATURE_TIME = 0x60
+    DREG_GYRO_PROC_X = 0x61
+    DREG_GYRO_PROC_Y = 0x62
+    DREG_GYRO_PROC_Z = 0x63
+    DREG_GYRO_PROC_TIME = 0x64
+    DREG_ACCEL_PROC_X = 0x65
+    DREG_ACCEL_PROC_Y = 0x66
+    DREG_ACCEL_PROC_Z = 0x67
+    DREG_ACCEL_PROC_TIME = 0x68
+    DREG_MAG_PROC_X = 0x69
+    DREG_MAG_PROC_Y = 0x6A
+    DREG_MAG_PROC_Z = 0x6B
+    DREG_MAG_PROC_TIME = 0x6C
+    DREG_QUAT_AB = 0x6D
+    DREG_QUAT_CD = 0x6E
+    DREG_QUAT_TIME = 0x6F
+    DREG_EULER_PHI_THETA = 0x70
+    DREG_EULER_PSI = 0x71
+    DREG_EULER_PHI_THETA_DOT = 0x72
+    DREG_EULER_PSI_DOT = 0x73
+    DREG_EULER_TIME = 0x74
+    DREG_POSITION_NORTH = 0x75
+    DREG_POSITION_EAST = 0x76
+    DREG_POSITION_UP = 0x77
+    DREG_POSITION_TIME = 0x78
+    DREG_VELOCITY_NORTH = 0x79
+    DREG_VELOCITY_EAST = 0x7A
+    DREG_VELOCITY_UP = 0x7B
+    DREG_VELOCITY_TIME = 0x7C
+    DREG_GPS_LATITUDE = 0x7D
+    DREG_GPS_LONGITUDE = 0x7E
+    DREG_GPS_ALTITUDE = 0x7F
+    DREG_GPS_COURSE = 0x80
+    DREG_GPS_SPEED = 0x81
+    DREG_GPS_TIME = 0x82
+    DREG_GPS_SAT_1_2 = 0x83
+    DREG_GPS_SAT_3_4 = 0x84
+    DREG_GPS_SAT_5_6 = 0x85
+    DREG_GPS_SAT_7_8 = 0x86
+    DREG_GPS_SAT_9_10 = 0x87
+    DREG_GPS_SAT_11_12 = 0x88
+    DREG_GYRO_BIAS_X = 0x89
+    DREG_GYRO_BIAS_Y = 0x8A
+    DREG_GYRO_BIAS_Z = 0x8B
+    GET_FW_REVISION = 0xAA
+    FLASH_COMMIT = 0xAB
+    RESET_TO_FACTORY = 0xAC
+    ZERO_GYROS = 0xAD
+    SET_HOME_POSITION = 0xAE
+    SET_MAG_REFERENCE = 0xB0
+    CALIBRATE_ACCELEROMETERS = 0xB1
+    RESET_EKF = 0xB3
+
+
+class HiddenReg(IntEnum):
+    GYRO_VARIANCE = 0x00
+    ACCEL_VARIANCE = 0x01
+
+
+# DREG_QUAT_AB .. DREG_EULER_TIME: 4 quaternion components, quaternion time, 3 Euler angles, 3 Euler rates, Euler time
+_ATTITUDE_STRUCT = struct.Struct('>hhhhfhhhxxhhhxxf')
+_QUAT_SCALE = 1 / 29789.09091
+_EULER_SCALE = 1 / 91.02222
+_EULER_RATE_SCALE = 1 / 16.0
+# DREG_GYRO_RAW_XY .. DREG_MAG_PROC_TIME: raw gyro, accel, mag with time stamps, temperature with time stamp,
+# processed gyro, accel, mag with time stamps
+_SENSOR_FRAME_STRUCT = struct.Struct('>hhhxxfhhhxxfhhhxxfffffffffffffff')
+# CREG_COM_SETTINGS, CREG_COM_RATES1 .. CREG_COM_RATES7: communication settings and broadcast rates as raw words
+_CREG_COM_STRUCT = struct.Struct('>IIIIIIII')
+CregComBlock = namedtuple('CregComBlock', 'settings rates1 rates2 rates3 rates4 rates5 rates6 rates7')
+# DREG_GYRO_RAW_XY .. DREG_MAG_RAW_Z: raw gyro, accel, mag x, y, z, time stamps are skipped
+_RAW_IMU_STRUCT = struct.Struct('>hhhxxxxxxhhhxxxxxxhhhxx')
+# DREG_POSITION_NORTH .. DREG_POSITION_TIME, DREG_VELOCITY_NORTH .. DREG_VELOCITY_TIME
+_POSE_STRUCT = struct.Struct('>ffff')
+# DREG_GPS_LATITUDE .. DREG_GPS_TIME
+_GPS_STRUCT = struct.Struct('>ffffff')
+# DREG_POSITION_NORTH .. DREG_GPS_TIME: position, velocity and GPS data in one contiguous block
+_NAV_STATE_STRUCT = struct.Struct('>ffffffffffffff')
+# DREG_GPS_SAT_1_2 .. DREG_GPS_SAT_11_12: id and SNR of 12 satellites
+_GPS_SAT_STRUCT = struct.Struct('>BBBBBBBBBBBBBBBBBBBBBBBB')
+GpsSatellites = namedtuple('GpsSatellites', 'ids snrs')
+# structs for blocks of consecutive float registers, by number of registers
+_FLOAT_BLOCK_STRUCTS = {}
+# CREG_ACCEL_CAL1_1 .. CREG_ACCEL_CAL3_3: 3x3 accelerometer calibration matrix, stored row by row
+_MATRIX_STRUCT = struct.Struct('>fffffffff')
+# CREG_ACCEL_BIAS_X .. CREG_ACCEL_BIAS_Z
+_VECTOR_STRUCT = struct.Struct('>fff')
+
+
+def _decode_sensor_frame(payload: bytes) -> Tuple[UM7AllRawPacket, UM7AllProcPacket]:
+    g_x, g_y, g_z, g_time, a_x, a_y, a_z, a_time, m_x, m_y, m_z, m_time, T, T_t, \
+        gp_x, gp_y, gp_z, gp_time, ap_x, ap_y, ap_z, ap_time, mp_x, mp_y, mp_z, mp_time = \
+        _SENSOR_FRAME_STRUCT.unpack(payload)
+    raw = UM7AllRawPacket(gyro_raw_x=g_x, gyro_raw_y=g_y, gyro_raw_z=g_z, gyro_raw_time=g_time,
+                          accel_raw_x=a_x, accel_raw_y=a_y, accel_raw_z=a_z, accel_raw_time=a_time,
+                          mag_raw_x=m_x, mag_raw_y=m_y, mag_raw_z=m_z, mag_raw_time=m_time,
+                          temperature=T, temperature_time=T_t)
+    proc = UM7AllProcPacket(gyro_proc_x=gp_x, gyro_proc_y=gp_y, gyro_proc_z=gp_z, gyro_proc_time=gp_time,
+                            accel_proc_x=ap_x, accel_proc_y=ap_y, accel_proc_z=ap_z, accel_proc_time=ap_time,
+                            mag_proc_x=mp_x, mag_proc_y=mp_y, mag_proc_z=mp_z, mag_proc_time=mp_time)
+    return raw, proc
 
 
 class UM7Registers(ABC):
+    # attributes used by every getter are slots, transport subclasses keep their own instance dict
+    __slots__ = ('svd_parser', 'svd_regs_by_name', 'svd_enum_tables')
 
     def __init__(self, **kwargs):
         self.svd_parser = RslSvdParser(svd_file=UM7Registers.find_svd('um7.svd'))
+        # resolve register objects once, so getters do not search through the register map on every read
+        self.svd_regs_by_name = {reg.name: reg for reg in self.svd_parser.regs + self.svd_parser.hidden_regs}
+        # enumerated values of bit fields indexed by field value, so getters do not search for them on every read
+        self.svd_enum_tables = {
+            (reg.name, field.name): tuple(field.find_enum_entry_by(value=value)
+                                          for value in range(2 ** (field.bit_range[0] - field.bit_range[1] + 1)))
+            for reg in self.svd_regs_by_name.values() for field in reg.fields if field.enumerated_values
+        }
 
     @staticmethod
     def find_svd(svd_file_name: str):
@@ -34,10 +310,144 @@ class UM7Registers(ABC):
     def read_register(self, reg_addr: int, **kw) -> bytes:
         pass
 
+    @abstractmethod
+    def read_consecutive_registers(self, reg_addr: int, num_registers: int, **kw) -> bytes:
+        pass
+
     @abstractmethod
     def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], **kw):
         pass
 
+    @abstractmethod
+    def write_consecutive_registers(self, reg_addr: int, payload: bytes, **kw):
+        pass
+
+    def try_read_register(self, reg_addr: int, **kw) -> Tuple[bool, bytes]:
+        try:
+            return True, self.read_register(reg_addr, **kw)
+        except RegisterReadError:
+            return False, bytes()
+
+    def read_attitude(self) -> Tuple[UM7QuaternionPacket, UM7EulerPacket]:
+        """
+        Reads quaternion and Euler angles registers (DREG_QUAT_AB .. DREG_EULER_TIME) in a single batch read
+        and scales the raw register values to physical units.
+        :return: quaternion as UM7QuaternionPacket; Euler angles and rates as UM7EulerPacket;
+        """
+        payload = self.read_consecutive_registers(Reg.DREG_QUAT_AB, 8)
+        q_w, q_x, q_y, q_z, q_time, roll, pitch, yaw, roll_rate, pitch_rate, yaw_rate, euler_time = \
+            _ATTITUDE_STRUCT.unpack(payload)
+        quaternion = UM7QuaternionPacket(q_w=q_w * _QUAT_SCALE, q_x=q_x * _QUAT_SCALE,
+                                         q_y=q_y * _QUAT_SCALE, q_z=q_z * _QUAT_SCALE, q_time=q_time)
+        euler = UM7EulerPacket(roll=roll * _EULER_SCALE, pitch=pitch * _EULER_SCALE, yaw=yaw * _EULER_SCALE,
+                               roll_rate=roll_rate * _EULER_RATE_SCALE, pitch_rate=pitch_rate * _EULER_RATE_SCALE,
+                               yaw_rate=yaw_rate * _EULER_RATE_SCALE, time_stamp=euler_time)
+        return quaternion, euler
+
+    def read_sensor_frame(self) -> Tuple[UM7AllRawPacket, UM7AllProcPacket]:
+        """
+        Reads raw and processed sensor data registers (DREG_GYRO_RAW_XY .. DREG_MAG_PROC_TIME) in a batch read
+        and decodes the whole frame at once.
+        :return: raw sensor data as UM7AllRawPacket; processed sensor data as UM7AllProcPacket;
+        """
+        payload = self.read_consecutive_registers(Reg.DREG_GYRO_RAW_XY, 23)
+        return _decode_sensor_frame(payload)
+
+    def read_creg_com_block(self) -> CregComBlock:
+        """
+        Reads communication registers (CREG_COM_SETTINGS .. CREG_COM_RATES7) in a single batch read.
+        :return: CregComBlock with raw register values of CREG_COM_SETTINGS and CREG_COM_RATES1 .. CREG_COM_RATES7;
+        """
+        return CregComBlock._make(_CREG_COM_STRUCT.unpack(self.read_consecutive_registers(Reg.CREG_COM_SETTINGS, 8)))
+
+    def read_float_registers(self, reg_addr: int, num_registers: int, **kw) -> Tuple[float, ...]:
+        """
+        Reads `num_registers` consecutive float registers starting at `reg_addr` in a batch read and decodes
+        all of them with a single unpack call.
+        :return: register values as floats;
+        """
+        block_struct = _FLOAT_BLOCK_STRUCTS.get(num_registers)
+        if block_struct is None:
+            block_struct = _FLOAT_BLOCK_STRUCTS[num_registers] = struct.Struct('>' + 'f' * num_registers)
+        return block_struct.unpack(self.read_consecutive_registers(reg_addr, num_registers, **kw))
+
+    def read_pose(self) -> UM7PosePacket:
+        """
+        Reads position registers (DREG_POSITION_NORTH .. DREG_POSITION_TIME) in a single batch read.
+        :return: position and its time stamp as UM7PosePacket;
+        """
+        return UM7PosePacket(*_POSE_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_POSITION_NORTH, 4)))
+
+    def read_velocity(self) -> UM7VelocityPacket:
+        """
+        Reads velocity registers (DREG_VELOCITY_NORTH .. DREG_VELOCITY_TIME) in a single batch read.
+        :return: velocity and its time stamp as UM7VelocityPacket;
+        """
+        return UM7VelocityPacket(*_POSE_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_VELOCITY_NORTH, 4)))
+
+    def read_gps(self) -> UM7GpsPacket:
+        """
+        Reads GPS registers (DREG_GPS_LATITUDE .. DREG_GPS_TIME) in a single batch read.
+        :return: GPS position, course, speed and time as UM7GpsPacket;
+        """
+        return UM7GpsPacket(*_GPS_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_GPS_LATITUDE, 6)))
+
+    def read_nav_state(self) -> Tuple[UM7PosePacket, UM7VelocityPacket, UM7GpsPacket]:
+        """
+        Reads position, velocity and GPS registers (DREG_POSITION_NORTH .. DREG_GPS_TIME) in a single batch read
+        and decodes all 14 floats with one unpack call.
+        :return: position as UM7PosePacket, velocity as UM7VelocityPacket and GPS data as UM7GpsPacket;
+        """
+        state = _NAV_STATE_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_POSITION_NORTH, 14))
+        return UM7PosePacket(*state[0:4]), UM7VelocityPacket(*state[4:8]), UM7GpsPacket(*state[8:14])
+
+    def read_gps_satellites(self) -> GpsSatellites:
+        """
+        Reads satellite registers (DREG_GPS_SAT_1_2 .. DREG_GPS_SAT_11_12) in a single batch read.
+        :return: GpsSatellites with the ids and the SNRs of the 12 satellites;
+        """
+        sats = _GPS_SAT_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_GPS_SAT_1_2, 6))
+        return GpsSatellites(sats[0::2], sats[1::2])
+
+    def stream_raw_imu(self, num_samples: int) -> array:
+        """
+        Reads raw gyro, accelerometer and magnetometer registers (DREG_GYRO_RAW_XY .. DREG_MAG_RAW_Z)
+        `num_samples` times, with one batch read per sample.
+        :return: flat int16 array with gyro x, y, z, accel x, y, z, mag x, y, z for every sample;
+        """
+        samples = array('h')
+        for _ in range(num_samples):
+            samples.extend(_RAW_IMU_STRUCT.unpack(self.read_consecutive_registers(Reg.DREG_GYRO_RAW_XY, 8)))
+        return samples
+
+    @property
+    def accel_cal_matrix(self) -> Tuple[Tuple[float, float, float], ...]:
+        """
+        Reads accelerometer calibration matrix registers (CREG_ACCEL_CAL1_1 .. CREG_ACCEL_CAL3_3) in a single
+        batch read.
+        :return: calibration matrix as 3 rows of 3 floats;
+        """
+        m = _MATRIX_STRUCT.unpack(self.read_consecutive_registers(Reg.CREG_ACCEL_CAL1_1, 9))
+        return m[0:3], m[3:6], m[6:9]
+
+    @accel_cal_matrix.setter
+    def accel_cal_matrix(self, new_value):
+        payload = _MATRIX_STRUCT.pack(*(value for row in new_value for value in row))
+        self.write_consecutive_registers(Reg.CREG_ACCEL_CAL1_1, payload)
+
+    @property
+    def accel_bias(self) -> Tuple[float, float, float]:
+        """
+        Reads accelerometer bias registers (CREG_ACCEL_BIAS_X .. CREG_ACCEL_BIAS_Z) in a single batch read.
+        :return: accelerometer bias as x, y, z floats;
+        """
+        return _VECTOR_STRUCT.unpack(self.read_consecutive_registers(Reg.CREG_ACCEL_BIAS_X, 3))
+
+    @accel_bias.setter
+    def accel_bias(self, new_value):
+        self.write_consecutive_registers(Reg.CREG_ACCEL_BIAS_X, _VECTOR_STRUCT.pack(*new_value))
+
+    # register properties below are generated from um7.svd by rsl_generate_um7.py, change the generator instead
     @property
     def creg_com_settings(self):
         """
@@ -50,32 +460,27 @@ class UM7Registers(ABC):
         [4]     : SAT -- If set, this bit causes satellite details to be transmitted whenever they are provided by the GPS. Satellite information is stored in registers 131 to 136. These registers will be transmitted in a batch packet of length 6 beginning at address 131.
         :return:  BAUD_RATE as bitField; GPS_BAUD as bitField; GPS as bitField; SAT as bitField; 
         """
-        addr = 0x00
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_SETTINGS')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            # find value for BAUD_RATE bit field
-            baud_rate_val = (reg.raw_value >> 28) & 0x000F
-            baud_rate_enum = reg.find_field_by(name='BAUD_RATE').find_enum_entry_by(value=baud_rate_val)
-            # find value for GPS_BAUD bit field
-            gps_baud_val = (reg.raw_value >> 24) & 0x000F
-            gps_baud_enum = reg.find_field_by(name='GPS_BAUD').find_enum_entry_by(value=gps_baud_val)
-            # find value for GPS bit field
-            gps_val = (reg.raw_value >> 8) & 0x0001
-            gps_enum = reg.find_field_by(name='GPS').find_enum_entry_by(value=gps_val)
-            # find value for SAT bit field
-            sat_val = (reg.raw_value >> 4) & 0x0001
-            sat_enum = reg.find_field_by(name='SAT').find_enum_entry_by(value=sat_val)
-
-            return reg, baud_rate_enum, gps_baud_enum, gps_enum, sat_enum
-        else:
-            return None
+        payload = self.read_register(0x00)
+        reg = self.svd_regs_by_name['CREG_COM_SETTINGS']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        # find value for BAUD_RATE bit field
+        baud_rate_val = reg.raw_value >> 28
+        baud_rate_enum = self.svd_enum_tables['CREG_COM_SETTINGS', 'BAUD_RATE'][baud_rate_val]
+        # find value for GPS_BAUD bit field
+        gps_baud_val = (reg.raw_value >> 24) & 0x000F
+        gps_baud_enum = self.svd_enum_tables['CREG_COM_SETTINGS', 'GPS_BAUD'][gps_baud_val]
+        # find value for GPS bit field
+        gps_val = (reg.raw_value >> 8) & 0x0001
+        gps_enum = self.svd_enum_tables['CREG_COM_SETTINGS', 'GPS'][gps_val]
+        # find value for SAT bit field
+        sat_val = (reg.raw_value >> 4) & 0x0001
+        sat_enum = self.svd_enum_tables['CREG_COM_SETTINGS', 'SAT'][sat_val]
+
+        return CregComSettings(reg, baud_rate_enum, gps_baud_enum, gps_enum, sat_enum)
 
     @creg_com_settings.setter
     def creg_com_settings(self, new_value):
-        addr = 0x00
-        self.write_register(addr, new_value)
+        self.write_register(0x00, new_value)
 
     @property
     def creg_com_rates1(self):
@@ -88,20 +493,15 @@ class UM7Registers(ABC):
         [15:8]  : RAW_MAG_RATE -- Specifies the desired raw magnetometer data broadcast rate in Hz. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  RAW_ACCEL_RATE as uint8_t; RAW_GYRO_RATE as uint8_t; RAW_MAG_RATE as uint8_t; 
         """
-        addr = 0x01
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            raw_accel_rate, raw_gyro_rate, raw_mag_rate = struct.unpack('>BBBx', payload[0:4])
-            return reg, raw_accel_rate, raw_gyro_rate, raw_mag_rate
-        else:
-            return None
+        payload = self.read_register(0x01)
+        reg = self.svd_regs_by_name['CREG_COM_RATES1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        raw_accel_rate, raw_gyro_rate, raw_mag_rate = _U8_U8_U8_PAD_STRUCT.unpack(payload)
+        return CregComRates1(reg, raw_accel_rate, raw_gyro_rate, raw_mag_rate)
 
     @creg_com_rates1.setter
     def creg_com_rates1(self, new_value):
-        addr = 0x01
-        self.write_register(addr, new_value)
+        self.write_register(0x01, new_value)
 
     @property
     def creg_com_rates2(self):
@@ -113,20 +513,15 @@ class UM7Registers(ABC):
         [7:0]   : ALL_RAW_RATE -- Specifies the desired broadcast rate for all raw sensor data. If set, this overrides the broadcast rate setting for individual raw data broadcast rates. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  TEMP_RATE as uint8_t; ALL_RAW_RATE as uint8_t; 
         """
-        addr = 0x02
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            temp_rate, all_raw_rate = struct.unpack('>BxxB', payload[0:4])
-            return reg, temp_rate, all_raw_rate
-        else:
-            return None
+        payload = self.read_register(0x02)
+        reg = self.svd_regs_by_name['CREG_COM_RATES2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        temp_rate, all_raw_rate = _U8_PAD_PAD_U8_STRUCT.unpack(payload)
+        return CregComRates2(reg, temp_rate, all_raw_rate)
 
     @creg_com_rates2.setter
     def creg_com_rates2(self, new_value):
-        addr = 0x02
-        self.write_register(addr, new_value)
+        self.write_register(0x02, new_value)
 
     @property
     def creg_com_rates3(self):
@@ -139,20 +534,15 @@ class UM7Registers(ABC):
         [15:8]  : PROC_MAG_RATE -- Specifies the desired broadcast rate for processed magnetometer data. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  PROC_ACCEL_RATE as uint8_t; PROC_GYRO_RATE as uint8_t; PROC_MAG_RATE as uint8_t; 
         """
-        addr = 0x03
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            proc_accel_rate, proc_gyro_rate, proc_mag_rate = struct.unpack('>BBBx', payload[0:4])
-            return reg, proc_accel_rate, proc_gyro_rate, proc_mag_rate
-        else:
-            return None
+        payload = self.read_register(0x03)
+        reg = self.svd_regs_by_name['CREG_COM_RATES3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        proc_accel_rate, proc_gyro_rate, proc_mag_rate = _U8_U8_U8_PAD_STRUCT.unpack(payload)
+        return CregComRates3(reg, proc_accel_rate, proc_gyro_rate, proc_mag_rate)
 
     @creg_com_rates3.setter
     def creg_com_rates3(self, new_value):
-        addr = 0x03
-        self.write_register(addr, new_value)
+        self.write_register(0x03, new_value)
 
     @property
     def creg_com_rates4(self):
@@ -163,20 +553,15 @@ class UM7Registers(ABC):
         [7:0]   : ALL_PROC_RATE -- Specifies the desired broadcast rate for raw all processed data. If set, this overrides the broadcast rate setting for individual processed data broadcast rates. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  ALL_PROC_RATE as uint8_t; 
         """
-        addr = 0x04
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES4')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            all_proc_rate = struct.unpack('>xxxB', payload[0:4])
-            return reg, all_proc_rate
-        else:
-            return None
+        payload = self.read_register(0x04)
+        reg = self.svd_regs_by_name['CREG_COM_RATES4']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        all_proc_rate = _PAD_PAD_PAD_U8_STRUCT.unpack_from(payload)[0]
+        return CregComRates4(reg, all_proc_rate)
 
     @creg_com_rates4.setter
     def creg_com_rates4(self, new_value):
-        addr = 0x04
-        self.write_register(addr, new_value)
+        self.write_register(0x04, new_value)
 
     @property
     def creg_com_rates5(self):
@@ -190,20 +575,15 @@ class UM7Registers(ABC):
         [7:0]   : VELOCITY_RATE -- Specifies the desired broadcast rate for velocity. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  QUAT_RATE as uint8_t; EULER_RATE as uint8_t; POSITION_RATE as uint8_t; VELOCITY_RATE as uint8_t; 
         """
-        addr = 0x05
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES5')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            quat_rate, euler_rate, position_rate, velocity_rate = struct.unpack('>BBBB', payload[0:4])
-            return reg, quat_rate, euler_rate, position_rate, velocity_rate
-        else:
-            return None
+        payload = self.read_register(0x05)
+        reg = self.svd_regs_by_name['CREG_COM_RATES5']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        quat_rate, euler_rate, position_rate, velocity_rate = payload
+        return CregComRates5(reg, quat_rate, euler_rate, position_rate, velocity_rate)
 
     @creg_com_rates5.setter
     def creg_com_rates5(self, new_value):
-        addr = 0x05
-        self.write_register(addr, new_value)
+        self.write_register(0x05, new_value)
 
     @property
     def creg_com_rates6(self):
@@ -217,24 +597,19 @@ class UM7Registers(ABC):
         [15:8]  : GYRO_BIAS_RATE -- Specifies the desired broadcast rate for gyro bias estimates. The data is stored as an unsigned 8-bit integer, yielding a maximum rate of 255 Hz.
         :return:  POSE_RATE as uint8_t; HEALTH_RATE as bitField; GYRO_BIAS_RATE as uint8_t; 
         """
-        addr = 0x06
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES6')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            pose_rate, gyro_bias_rate = struct.unpack('>BxBx', payload[0:4])
-            # find value for HEALTH_RATE bit field
-            health_rate_val = (reg.raw_value >> 16) & 0x000F
-            health_rate_enum = reg.find_field_by(name='HEALTH_RATE').find_enum_entry_by(value=health_rate_val)
+        payload = self.read_register(0x06)
+        reg = self.svd_regs_by_name['CREG_COM_RATES6']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        pose_rate, gyro_bias_rate = _U8_PAD_U8_PAD_STRUCT.unpack(payload)
+        # find value for HEALTH_RATE bit field
+        health_rate_val = (reg.raw_value >> 16) & 0x000F
+        health_rate_enum = self.svd_enum_tables['CREG_COM_RATES6', 'HEALTH_RATE'][health_rate_val]
 
-            return reg, pose_rate, gyro_bias_rate, reg, health_rate_enum
-        else:
-            return None
+        return CregComRates6(reg, pose_rate, gyro_bias_rate, health_rate_enum)
 
     @creg_com_rates6.setter
     def creg_com_rates6(self, new_value):
-        addr = 0x06
-        self.write_register(addr, new_value)
+        self.write_register(0x06, new_value)
 
     @property
     def creg_com_rates7(self):
@@ -250,41 +625,36 @@ class UM7Registers(ABC):
         [7:4]   : NMEA_QUAT_RATE -- Specifies the desired broadcast rate for Redshift Labs Pty Ltd NMEA-style quaternion packet.
         :return:  NMEA_HEALTH_RATE as bitField; NMEA_POSE_RATE as bitField; NMEA_ATTITUDE_RATE as bitField; NMEA_SENSOR_RATE as bitField; NMEA_RATES_RATE as bitField; NMEA_GPS_POSE_RATE as bitField; NMEA_QUAT_RATE as bitField; 
         """
-        addr = 0x07
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_COM_RATES7')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            # find value for NMEA_HEALTH_RATE bit field
-            nmea_health_rate_val = (reg.raw_value >> 28) & 0x000F
-            nmea_health_rate_enum = reg.find_field_by(name='NMEA_HEALTH_RATE').find_enum_entry_by(value=nmea_health_rate_val)
-            # find value for NMEA_POSE_RATE bit field
-            nmea_pose_rate_val = (reg.raw_value >> 24) & 0x000F
-            nmea_pose_rate_enum = reg.find_field_by(name='NMEA_POSE_RATE').find_enum_entry_by(value=nmea_pose_rate_val)
-            # find value for NMEA_ATTITUDE_RATE bit field
-            nmea_attitude_rate_val = (reg.raw_value >> 20) & 0x000F
-            nmea_attitude_rate_enum = reg.find_field_by(name='NMEA_ATTITUDE_RATE').find_enum_entry_by(value=nmea_attitude_rate_val)
-            # find value for NMEA_SENSOR_RATE bit field
-            nmea_sensor_rate_val = (reg.raw_value >> 16) & 0x000F
-            nmea_sensor_rate_enum = reg.find_field_by(name='NMEA_SENSOR_RATE').find_enum_entry_by(value=nmea_sensor_rate_val)
-            # find value for NMEA_RATES_RATE bit field
-            nmea_rates_rate_val = (reg.raw_value >> 12) & 0x000F
-            nmea_rates_rate_enum = reg.find_field_by(name='NMEA_RATES_RATE').find_enum_entry_by(value=nmea_rates_rate_val)
-            # find value for NMEA_GPS_POSE_RATE bit field
-            nmea_gps_pose_rate_val = (reg.raw_value >> 8) & 0x000F
-            nmea_gps_pose_rate_enum = reg.find_field_by(name='NMEA_GPS_POSE_RATE').find_enum_entry_by(value=nmea_gps_pose_rate_val)
-            # find value for NMEA_QUAT_RATE bit field
-            nmea_quat_rate_val = (reg.raw_value >> 4) & 0x000F
-            nmea_quat_rate_enum = reg.find_field_by(name='NMEA_QUAT_RATE').find_enum_entry_by(value=nmea_quat_rate_val)
-
-            return reg, nmea_health_rate_enum, nmea_pose_rate_enum, nmea_attitude_rate_enum, nmea_sensor_rate_enum, nmea_rates_rate_enum, nmea_gps_pose_rate_enum, nmea_quat_rate_enum
-        else:
-            return None
+        payload = self.read_register(0x07)
+        reg = self.svd_regs_by_name['CREG_COM_RATES7']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        # find value for NMEA_HEALTH_RATE bit field
+        nmea_health_rate_val = reg.raw_value >> 28
+        nmea_health_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_HEALTH_RATE'][nmea_health_rate_val]
+        # find value for NMEA_POSE_RATE bit field
+        nmea_pose_rate_val = (reg.raw_value >> 24) & 0x000F
+        nmea_pose_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_POSE_RATE'][nmea_pose_rate_val]
+        # find value for NMEA_ATTITUDE_RATE bit field
+        nmea_attitude_rate_val = (reg.raw_value >> 20) & 0x000F
+        nmea_attitude_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_ATTITUDE_RATE'][nmea_attitude_rate_val]
+        # find value for NMEA_SENSOR_RATE bit field
+        nmea_sensor_rate_val = (reg.raw_value >> 16) & 0x000F
+        nmea_sensor_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_SENSOR_RATE'][nmea_sensor_rate_val]
+        # find value for NMEA_RATES_RATE bit field
+        nmea_rates_rate_val = (reg.raw_value >> 12) & 0x000F
+        nmea_rates_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_RATES_RATE'][nmea_rates_rate_val]
+        # find value for NMEA_GPS_POSE_RATE bit field
+        nmea_gps_pose_rate_val = (reg.raw_value >> 8) & 0x000F
+        nmea_gps_pose_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_GPS_POSE_RATE'][nmea_gps_pose_rate_val]
+        # find value for NMEA_QUAT_RATE bit field
+        nmea_quat_rate_val = (reg.raw_value >> 4) & 0x000F
+        nmea_quat_rate_enum = self.svd_enum_tables['CREG_COM_RATES7', 'NMEA_QUAT_RATE'][nmea_quat_rate_val]
+
+        return CregComRates7(reg, nmea_health_rate_enum, nmea_pose_rate_enum, nmea_attitude_rate_enum, nmea_sensor_rate_enum, nmea_rates_rate_enum, nmea_gps_pose_rate_enum, nmea_quat_rate_enum)
 
     @creg_com_rates7.setter
     def creg_com_rates7(self, new_value):
-        addr = 0x07
-        self.write_register(addr, new_value)
+        self.write_register(0x07, new_value)
 
     @property
     def creg_misc_settings(self):
@@ -297,32 +667,27 @@ class UM7Registers(ABC):
         [0]     : MAG -- If set, the magnetometer will be used in state updates.
         :return:  PPS as bitField; ZG as bitField; Q as bitField; MAG as bitField; 
         """
-        addr = 0x08
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MISC_SETTINGS')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            # find value for PPS bit field
-            pps_val = (reg.raw_value >> 8) & 0x0001
-            pps_enum = reg.find_field_by(name='PPS').find_enum_entry_by(value=pps_val)
-            # find value for ZG bit field
-            zg_val = (reg.raw_value >> 2) & 0x0001
-            zg_enum = reg.find_field_by(name='ZG').find_enum_entry_by(value=zg_val)
-            # find value for Q bit field
-            q_val = (reg.raw_value >> 1) & 0x0001
-            q_enum = reg.find_field_by(name='Q').find_enum_entry_by(value=q_val)
-            # find value for MAG bit field
-            mag_val = (reg.raw_value >> 0) & 0x0001
-            mag_enum = reg.find_field_by(name='MAG').find_enum_entry_by(value=mag_val)
-
-            return reg, pps_enum, zg_enum, q_enum, mag_enum
-        else:
-            return None
+        payload = self.read_register(0x08)
+        reg = self.svd_regs_by_name['CREG_MISC_SETTINGS']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        # find value for PPS bit field
+        pps_val = (reg.raw_value >> 8) & 0x0001
+        pps_enum = self.svd_enum_tables['CREG_MISC_SETTINGS', 'PPS'][pps_val]
+        # find value for ZG bit field
+        zg_val = (reg.raw_value >> 2) & 0x0001
+        zg_enum = self.svd_enum_tables['CREG_MISC_SETTINGS', 'ZG'][zg_val]
+        # find value for Q bit field
+        q_val = (reg.raw_value >> 1) & 0x0001
+        q_enum = self.svd_enum_tables['CREG_MISC_SETTINGS', 'Q'][q_val]
+        # find value for MAG bit field
+        mag_val = reg.raw_value & 0x0001
+        mag_enum = self.svd_enum_tables['CREG_MISC_SETTINGS', 'MAG'][mag_val]
+
+        return CregMiscSettings(reg, pps_enum, zg_enum, q_enum, mag_enum)
 
     @creg_misc_settings.setter
     def creg_misc_settings(self, new_value):
-        addr = 0x08
-        self.write_register(addr, new_value)
+        self.write_register(0x08, new_value)
 
     @property
     def creg_home_north(self):
@@ -333,20 +698,15 @@ class UM7Registers(ABC):
         [31:0]  : SET_HOME_NORTH -- North Position (32-bit IEEE Floating Point Value)
         :return:  SET_HOME_NORTH as float; 
         """
-        addr = 0x09
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_HOME_NORTH')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            set_home_north = struct.unpack('>f', payload[0:4])
-            return reg, set_home_north
-        else:
-            return None
+        payload = self.read_register(0x09)
+        reg = self.svd_regs_by_name['CREG_HOME_NORTH']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        set_home_north = _F32_STRUCT.unpack_from(payload)[0]
+        return CregHomeNorth(reg, set_home_north)
 
     @creg_home_north.setter
     def creg_home_north(self, new_value):
-        addr = 0x09
-        self.write_register(addr, new_value)
+        self.write_register(0x09, new_value)
 
     @property
     def creg_home_east(self):
@@ -357,20 +717,15 @@ class UM7Registers(ABC):
         [31:0]  : SET_HOME_EAST -- East Position (32-bit IEEE Floating Point Value)
         :return:  SET_HOME_EAST as float; 
         """
-        addr = 0x0A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_HOME_EAST')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            set_home_east = struct.unpack('>f', payload[0:4])
-            return reg, set_home_east
-        else:
-            return None
+        payload = self.read_register(0x0A)
+        reg = self.svd_regs_by_name['CREG_HOME_EAST']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        set_home_east = _F32_STRUCT.unpack_from(payload)[0]
+        return CregHomeEast(reg, set_home_east)
 
     @creg_home_east.setter
     def creg_home_east(self, new_value):
-        addr = 0x0A
-        self.write_register(addr, new_value)
+        self.write_register(0x0A, new_value)
 
     @property
     def creg_home_up(self):
@@ -381,20 +736,15 @@ class UM7Registers(ABC):
         [31:0]  : SET_HOME_UP -- Altitude Position (32-bit IEEE Floating Point Value)
         :return:  SET_HOME_UP as float; 
         """
-        addr = 0x0B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_HOME_UP')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            set_home_up = struct.unpack('>f', payload[0:4])
-            return reg, set_home_up
-        else:
-            return None
+        payload = self.read_register(0x0B)
+        reg = self.svd_regs_by_name['CREG_HOME_UP']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        set_home_up = _F32_STRUCT.unpack_from(payload)[0]
+        return CregHomeUp(reg, set_home_up)
 
     @creg_home_up.setter
     def creg_home_up(self, new_value):
-        addr = 0x0B
-        self.write_register(addr, new_value)
+        self.write_register(0x0B, new_value)
 
     @property
     def creg_gyro_trim_x(self):
@@ -405,20 +755,15 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_TRIM_X -- 32-bit IEEE Floating Point Value
         :return:  GYRO_TRIM_X as float; 
         """
-        addr = 0x0C
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_GYRO_TRIM_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_trim_x = struct.unpack('>f', payload[0:4])
-            return reg, gyro_trim_x
-        else:
-            return None
+        payload = self.read_register(0x0C)
+        reg = self.svd_regs_by_name['CREG_GYRO_TRIM_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_trim_x = _F32_STRUCT.unpack_from(payload)[0]
+        return CregGyroTrimX(reg, gyro_trim_x)
 
     @creg_gyro_trim_x.setter
     def creg_gyro_trim_x(self, new_value):
-        addr = 0x0C
-        self.write_register(addr, new_value)
+        self.write_register(0x0C, new_value)
 
     @property
     def creg_gyro_trim_y(self):
@@ -429,20 +774,15 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_TRIM_Y -- 32-bit IEEE Floating Point Value
         :return:  GYRO_TRIM_Y as float; 
         """
-        addr = 0x0D
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_GYRO_TRIM_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_trim_y = struct.unpack('>f', payload[0:4])
-            return reg, gyro_trim_y
-        else:
-            return None
+        payload = self.read_register(0x0D)
+        reg = self.svd_regs_by_name['CREG_GYRO_TRIM_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_trim_y = _F32_STRUCT.unpack_from(payload)[0]
+        return CregGyroTrimY(reg, gyro_trim_y)
 
     @creg_gyro_trim_y.setter
     def creg_gyro_trim_y(self, new_value):
-        addr = 0x0D
-        self.write_register(addr, new_value)
+        self.write_register(0x0D, new_value)
 
     @property
     def creg_gyro_trim_z(self):
@@ -453,20 +793,15 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_TRIM_Z -- 32-bit IEEE Floating Point Value
         :return:  GYRO_TRIM_Z as float; 
         """
-        addr = 0x0E
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_GYRO_TRIM_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_trim_z = struct.unpack('>f', payload[0:4])
-            return reg, gyro_trim_z
-        else:
-            return None
+        payload = self.read_register(0x0E)
+        reg = self.svd_regs_by_name['CREG_GYRO_TRIM_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_trim_z = _F32_STRUCT.unpack_from(payload)[0]
+        return CregGyroTrimZ(reg, gyro_trim_z)
 
     @creg_gyro_trim_z.setter
     def creg_gyro_trim_z(self, new_value):
-        addr = 0x0E
-        self.write_register(addr, new_value)
+        self.write_register(0x0E, new_value)
 
     @property
     def creg_mag_cal1_1(self):
@@ -476,20 +811,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL1_1 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL1_1 as float; 
         """
-        addr = 0x0F
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL1_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal1_1 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal1_1
-        else:
-            return None
+        payload = self.read_register(0x0F)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL1_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal1_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal11(reg, mag_cal1_1)
 
     @creg_mag_cal1_1.setter
     def creg_mag_cal1_1(self, new_value):
-        addr = 0x0F
-        self.write_register(addr, new_value)
+        self.write_register(0x0F, new_value)
 
     @property
     def creg_mag_cal1_2(self):
@@ -499,20 +829,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL1_2 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL1_2 as float; 
         """
-        addr = 0x10
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL1_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal1_2 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal1_2
-        else:
-            return None
+        payload = self.read_register(0x10)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL1_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal1_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal12(reg, mag_cal1_2)
 
     @creg_mag_cal1_2.setter
     def creg_mag_cal1_2(self, new_value):
-        addr = 0x10
-        self.write_register(addr, new_value)
+        self.write_register(0x10, new_value)
 
     @property
     def creg_mag_cal1_3(self):
@@ -522,20 +847,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL1_3 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL1_3 as float; 
         """
-        addr = 0x11
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL1_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal1_3 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal1_3
-        else:
-            return None
+        payload = self.read_register(0x11)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL1_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal1_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal13(reg, mag_cal1_3)
 
     @creg_mag_cal1_3.setter
     def creg_mag_cal1_3(self, new_value):
-        addr = 0x11
-        self.write_register(addr, new_value)
+        self.write_register(0x11, new_value)
 
     @property
     def creg_mag_cal2_1(self):
@@ -545,20 +865,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL2_1 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL2_1 as float; 
         """
-        addr = 0x12
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL2_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal2_1 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal2_1
-        else:
-            return None
+        payload = self.read_register(0x12)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL2_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal2_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal21(reg, mag_cal2_1)
 
     @creg_mag_cal2_1.setter
     def creg_mag_cal2_1(self, new_value):
-        addr = 0x12
-        self.write_register(addr, new_value)
+        self.write_register(0x12, new_value)
 
     @property
     def creg_mag_cal2_2(self):
@@ -568,20 +883,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL2_2 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL2_2 as float; 
         """
-        addr = 0x13
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL2_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal2_2 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal2_2
-        else:
-            return None
+        payload = self.read_register(0x13)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL2_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal2_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal22(reg, mag_cal2_2)
 
     @creg_mag_cal2_2.setter
     def creg_mag_cal2_2(self, new_value):
-        addr = 0x13
-        self.write_register(addr, new_value)
+        self.write_register(0x13, new_value)
 
     @property
     def creg_mag_cal2_3(self):
@@ -591,20 +901,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL2_3 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL2_3 as float; 
         """
-        addr = 0x14
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL2_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal2_3 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal2_3
-        else:
-            return None
+        payload = self.read_register(0x14)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL2_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal2_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal23(reg, mag_cal2_3)
 
     @creg_mag_cal2_3.setter
     def creg_mag_cal2_3(self, new_value):
-        addr = 0x14
-        self.write_register(addr, new_value)
+        self.write_register(0x14, new_value)
 
     @property
     def creg_mag_cal3_1(self):
@@ -614,20 +919,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL3_1 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL3_1 as float; 
         """
-        addr = 0x15
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL3_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal3_1 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal3_1
-        else:
-            return None
+        payload = self.read_register(0x15)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL3_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal3_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal31(reg, mag_cal3_1)
 
     @creg_mag_cal3_1.setter
     def creg_mag_cal3_1(self, new_value):
-        addr = 0x15
-        self.write_register(addr, new_value)
+        self.write_register(0x15, new_value)
 
     @property
     def creg_mag_cal3_2(self):
@@ -637,20 +937,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL3_2 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL3_2 as float; 
         """
-        addr = 0x16
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL3_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal3_2 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal3_2
-        else:
-            return None
+        payload = self.read_register(0x16)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL3_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal3_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal32(reg, mag_cal3_2)
 
     @creg_mag_cal3_2.setter
     def creg_mag_cal3_2(self, new_value):
-        addr = 0x16
-        self.write_register(addr, new_value)
+        self.write_register(0x16, new_value)
 
     @property
     def creg_mag_cal3_3(self):
@@ -660,20 +955,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_CAL3_3 -- 32-bit IEEE Floating Point Value
         :return:  MAG_CAL3_3 as float; 
         """
-        addr = 0x17
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_CAL3_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_cal3_3 = struct.unpack('>f', payload[0:4])
-            return reg, mag_cal3_3
-        else:
-            return None
+        payload = self.read_register(0x17)
+        reg = self.svd_regs_by_name['CREG_MAG_CAL3_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_cal3_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagCal33(reg, mag_cal3_3)
 
     @creg_mag_cal3_3.setter
     def creg_mag_cal3_3(self, new_value):
-        addr = 0x17
-        self.write_register(addr, new_value)
+        self.write_register(0x17, new_value)
 
     @property
     def creg_mag_bias_x(self):
@@ -684,20 +974,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_BIAS_X -- 32-bit IEEE Floating Point Value
         :return:  MAG_BIAS_X as float; 
         """
-        addr = 0x18
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_BIAS_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_bias_x = struct.unpack('>f', payload[0:4])
-            return reg, mag_bias_x
-        else:
-            return None
+        payload = self.read_register(0x18)
+        reg = self.svd_regs_by_name['CREG_MAG_BIAS_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_bias_x = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagBiasX(reg, mag_bias_x)
 
     @creg_mag_bias_x.setter
     def creg_mag_bias_x(self, new_value):
-        addr = 0x18
-        self.write_register(addr, new_value)
+        self.write_register(0x18, new_value)
 
     @property
     def creg_mag_bias_y(self):
@@ -708,20 +993,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_BIAS_Y -- 32-bit IEEE Floating Point Value
         :return:  MAG_BIAS_Y as float; 
         """
-        addr = 0x19
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_BIAS_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_bias_y = struct.unpack('>f', payload[0:4])
-            return reg, mag_bias_y
-        else:
-            return None
+        payload = self.read_register(0x19)
+        reg = self.svd_regs_by_name['CREG_MAG_BIAS_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_bias_y = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagBiasY(reg, mag_bias_y)
 
     @creg_mag_bias_y.setter
     def creg_mag_bias_y(self, new_value):
-        addr = 0x19
-        self.write_register(addr, new_value)
+        self.write_register(0x19, new_value)
 
     @property
     def creg_mag_bias_z(self):
@@ -732,20 +1012,15 @@ class UM7Registers(ABC):
         [31:0]  : MAG_BIAS_Z -- 32-bit IEEE Floating Point Value
         :return:  MAG_BIAS_Z as float; 
         """
-        addr = 0x1A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_MAG_BIAS_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_bias_z = struct.unpack('>f', payload[0:4])
-            return reg, mag_bias_z
-        else:
-            return None
+        payload = self.read_register(0x1A)
+        reg = self.svd_regs_by_name['CREG_MAG_BIAS_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_bias_z = _F32_STRUCT.unpack_from(payload)[0]
+        return CregMagBiasZ(reg, mag_bias_z)
 
     @creg_mag_bias_z.setter
     def creg_mag_bias_z(self, new_value):
-        addr = 0x1A
-        self.write_register(addr, new_value)
+        self.write_register(0x1A, new_value)
 
     @property
     def creg_accel_cal1_1(self):
@@ -755,20 +1030,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL1_1 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL1_1 as float; 
         """
-        addr = 0x1B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL1_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal1_1 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal1_1
-        else:
-            return None
+        payload = self.read_register(0x1B)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL1_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal1_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal11(reg, accel_cal1_1)
 
     @creg_accel_cal1_1.setter
     def creg_accel_cal1_1(self, new_value):
-        addr = 0x1B
-        self.write_register(addr, new_value)
+        self.write_register(0x1B, new_value)
 
     @property
     def creg_accel_cal1_2(self):
@@ -778,20 +1048,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL1_2 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL1_2 as float; 
         """
-        addr = 0x1C
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL1_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal1_2 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal1_2
-        else:
-            return None
+        payload = self.read_register(0x1C)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL1_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal1_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal12(reg, accel_cal1_2)
 
     @creg_accel_cal1_2.setter
     def creg_accel_cal1_2(self, new_value):
-        addr = 0x1C
-        self.write_register(addr, new_value)
+        self.write_register(0x1C, new_value)
 
     @property
     def creg_accel_cal1_3(self):
@@ -801,20 +1066,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL1_3 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL1_3 as float; 
         """
-        addr = 0x1D
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL1_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal1_3 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal1_3
-        else:
-            return None
+        payload = self.read_register(0x1D)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL1_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal1_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal13(reg, accel_cal1_3)
 
     @creg_accel_cal1_3.setter
     def creg_accel_cal1_3(self, new_value):
-        addr = 0x1D
-        self.write_register(addr, new_value)
+        self.write_register(0x1D, new_value)
 
     @property
     def creg_accel_cal2_1(self):
@@ -824,20 +1084,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL2_1 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL2_1 as float; 
         """
-        addr = 0x1E
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL2_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal2_1 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal2_1
-        else:
-            return None
+        payload = self.read_register(0x1E)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL2_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal2_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal21(reg, accel_cal2_1)
 
     @creg_accel_cal2_1.setter
     def creg_accel_cal2_1(self, new_value):
-        addr = 0x1E
-        self.write_register(addr, new_value)
+        self.write_register(0x1E, new_value)
 
     @property
     def creg_accel_cal2_2(self):
@@ -847,20 +1102,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL2_2 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL2_2 as float; 
         """
-        addr = 0x1F
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL2_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal2_2 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal2_2
-        else:
-            return None
+        payload = self.read_register(0x1F)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL2_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal2_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal22(reg, accel_cal2_2)
 
     @creg_accel_cal2_2.setter
     def creg_accel_cal2_2(self, new_value):
-        addr = 0x1F
-        self.write_register(addr, new_value)
+        self.write_register(0x1F, new_value)
 
     @property
     def creg_accel_cal2_3(self):
@@ -870,20 +1120,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL2_3 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL2_3 as float; 
         """
-        addr = 0x20
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL2_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal2_3 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal2_3
-        else:
-            return None
+        payload = self.read_register(0x20)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL2_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal2_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal23(reg, accel_cal2_3)
 
     @creg_accel_cal2_3.setter
     def creg_accel_cal2_3(self, new_value):
-        addr = 0x20
-        self.write_register(addr, new_value)
+        self.write_register(0x20, new_value)
 
     @property
     def creg_accel_cal3_1(self):
@@ -893,20 +1138,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL3_1 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL3_1 as float; 
         """
-        addr = 0x21
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL3_1')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal3_1 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal3_1
-        else:
-            return None
+        payload = self.read_register(0x21)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL3_1']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal3_1 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal31(reg, accel_cal3_1)
 
     @creg_accel_cal3_1.setter
     def creg_accel_cal3_1(self, new_value):
-        addr = 0x21
-        self.write_register(addr, new_value)
+        self.write_register(0x21, new_value)
 
     @property
     def creg_accel_cal3_2(self):
@@ -916,20 +1156,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL3_2 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL3_2 as float; 
         """
-        addr = 0x22
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL3_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal3_2 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal3_2
-        else:
-            return None
+        payload = self.read_register(0x22)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL3_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal3_2 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal32(reg, accel_cal3_2)
 
     @creg_accel_cal3_2.setter
     def creg_accel_cal3_2(self, new_value):
-        addr = 0x22
-        self.write_register(addr, new_value)
+        self.write_register(0x22, new_value)
 
     @property
     def creg_accel_cal3_3(self):
@@ -939,20 +1174,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_CAL3_3 -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_CAL3_3 as float; 
         """
-        addr = 0x23
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_CAL3_3')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_cal3_3 = struct.unpack('>f', payload[0:4])
-            return reg, accel_cal3_3
-        else:
-            return None
+        payload = self.read_register(0x23)
+        reg = self.svd_regs_by_name['CREG_ACCEL_CAL3_3']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_cal3_3 = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelCal33(reg, accel_cal3_3)
 
     @creg_accel_cal3_3.setter
     def creg_accel_cal3_3(self, new_value):
-        addr = 0x23
-        self.write_register(addr, new_value)
+        self.write_register(0x23, new_value)
 
     @property
     def creg_accel_bias_x(self):
@@ -963,20 +1193,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_BIAS_X -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_BIAS_X as float; 
         """
-        addr = 0x24
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_BIAS_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_bias_x = struct.unpack('>f', payload[0:4])
-            return reg, accel_bias_x
-        else:
-            return None
+        payload = self.read_register(0x24)
+        reg = self.svd_regs_by_name['CREG_ACCEL_BIAS_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_bias_x = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelBiasX(reg, accel_bias_x)
 
     @creg_accel_bias_x.setter
     def creg_accel_bias_x(self, new_value):
-        addr = 0x24
-        self.write_register(addr, new_value)
+        self.write_register(0x24, new_value)
 
     @property
     def creg_accel_bias_y(self):
@@ -987,20 +1212,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_BIAS_Y -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_BIAS_Y as float; 
         """
-        addr = 0x25
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_BIAS_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_bias_y = struct.unpack('>f', payload[0:4])
-            return reg, accel_bias_y
-        else:
-            return None
+        payload = self.read_register(0x25)
+        reg = self.svd_regs_by_name['CREG_ACCEL_BIAS_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_bias_y = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelBiasY(reg, accel_bias_y)
 
     @creg_accel_bias_y.setter
     def creg_accel_bias_y(self, new_value):
-        addr = 0x25
-        self.write_register(addr, new_value)
+        self.write_register(0x25, new_value)
 
     @property
     def creg_accel_bias_z(self):
@@ -1011,20 +1231,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_BIAS_Z -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_BIAS_Z as float; 
         """
-        addr = 0x26
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='CREG_ACCEL_BIAS_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_bias_z = struct.unpack('>f', payload[0:4])
-            return reg, accel_bias_z
-        else:
-            return None
+        payload = self.read_register(0x26)
+        reg = self.svd_regs_by_name['CREG_ACCEL_BIAS_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_bias_z = _F32_STRUCT.unpack_from(payload)[0]
+        return CregAccelBiasZ(reg, accel_bias_z)
 
     @creg_accel_bias_z.setter
     def creg_accel_bias_z(self, new_value):
-        addr = 0x26
-        self.write_register(addr, new_value)
+        self.write_register(0x26, new_value)
 
     @property
     def dreg_health(self):
@@ -1045,45 +1260,38 @@ class UM7Registers(ABC):
         [0]     : GPS -- This bit is set if the GPS fails to send a packet for more than two seconds. If a GPS packet is ever received, this bit is cleared.
         :return:  SATS_USED as bitField; HDOP as bitField; SATS_IN_VIEW as bitField; OVF as bitField; MG_N as bitField; ACC_N as bitField; ACCEL as bitField; GYRO as bitField; MAG as bitField; GPS as bitField; 
         """
-        addr = 0x55
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_HEALTH')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            # find value for SATS_USED bit field
-            sats_used_val = (reg.raw_value >> 26) & 0x003F
-            sats_used_enum = reg.find_field_by(name='SATS_USED').find_enum_entry_by(value=sats_used_val)
-            # find value for HDOP bit field
-            hdop_val = (reg.raw_value >> 16) & 0x03FF
-            hdop_enum = reg.find_field_by(name='HDOP').find_enum_entry_by(value=hdop_val)
-            # find value for SATS_IN_VIEW bit field
-            sats_in_view_val = (reg.raw_value >> 10) & 0x003F
-            sats_in_view_enum = reg.find_field_by(name='SATS_IN_VIEW').find_enum_entry_by(value=sats_in_view_val)
-            # find value for OVF bit field
-            ovf_val = (reg.raw_value >> 8) & 0x0001
-            ovf_enum = reg.find_field_by(name='OVF').find_enum_entry_by(value=ovf_val)
-            # find value for MG_N bit field
-            mg_n_val = (reg.raw_value >> 5) & 0x0001
-            mg_n_enum = reg.find_field_by(name='MG_N').find_enum_entry_by(value=mg_n_val)
-            # find value for ACC_N bit field
-            acc_n_val = (reg.raw_value >> 4) & 0x0001
-            acc_n_enum = reg.find_field_by(name='ACC_N').find_enum_entry_by(value=acc_n_val)
-            # find value for ACCEL bit field
-            accel_val = (reg.raw_value >> 3) & 0x0001
-            accel_enum = reg.find_field_by(name='ACCEL').find_enum_entry_by(value=accel_val)
-            # find value for GYRO bit field
-            gyro_val = (reg.raw_value >> 2) & 0x0001
-            gyro_enum = reg.find_field_by(name='GYRO').find_enum_entry_by(value=gyro_val)
-            # find value for MAG bit field
-            mag_val = (reg.raw_value >> 1) & 0x0001
-            mag_enum = reg.find_field_by(name='MAG').find_enum_entry_by(value=mag_val)
-            # find value for GPS bit field
-            gps_val = (reg.raw_value >> 0) & 0x0001
-            gps_enum = reg.find_field_by(name='GPS').find_enum_entry_by(value=gps_val)
-
-            return reg, sats_used_enum, hdop_enum, sats_in_view_enum, ovf_enum, mg_n_enum, acc_n_enum, accel_enum, gyro_enum, mag_enum, gps_enum
-        else:
-            return None
+        payload = self.read_register(0x55)
+        reg = self.svd_regs_by_name['DREG_HEALTH']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        # find value for SATS_USED bit field
+        sats_used_val = reg.raw_value >> 26
+        # find value for HDOP bit field
+        hdop_val = (reg.raw_value >> 16) & 0x03FF
+        # find value for SATS_IN_VIEW bit field
+        sats_in_view_val = (reg.raw_value >> 10) & 0x003F
+        # find value for OVF bit field
+        ovf_val = (reg.raw_value >> 8) & 0x0001
+        ovf_enum = self.svd_enum_tables['DREG_HEALTH', 'OVF'][ovf_val]
+        # find value for MG_N bit field
+        mg_n_val = (reg.raw_value >> 5) & 0x0001
+        mg_n_enum = self.svd_enum_tables['DREG_HEALTH', 'MG_N'][mg_n_val]
+        # find value for ACC_N bit field
+        acc_n_val = (reg.raw_value >> 4) & 0x0001
+        acc_n_enum = self.svd_enum_tables['DREG_HEALTH', 'ACC_N'][acc_n_val]
+        # find value for ACCEL bit field
+        accel_val = (reg.raw_value >> 3) & 0x0001
+        accel_enum = self.svd_enum_tables['DREG_HEALTH', 'ACCEL'][accel_val]
+        # find value for GYRO bit field
+        gyro_val = (reg.raw_value >> 2) & 0x0001
+        gyro_enum = self.svd_enum_tables['DREG_HEALTH', 'GYRO'][gyro_val]
+        # find value for MAG bit field
+        mag_val = (reg.raw_value >> 1) & 0x0001
+        mag_enum = self.svd_enum_tables['DREG_HEALTH', 'MAG'][mag_val]
+        # find value for GPS bit field
+        gps_val = reg.raw_value & 0x0001
+        gps_enum = self.svd_enum_tables['DREG_HEALTH', 'GPS'][gps_val]
+
+        return DregHealth(reg, sats_used_val, hdop_val, sats_in_view_val, ovf_enum, mg_n_enum, acc_n_enum, accel_enum, gyro_enum, mag_enum, gps_enum)
 
     @property
     def dreg_gyro_raw_xy(self):
@@ -1094,15 +1302,11 @@ class UM7Registers(ABC):
         [15:0]  : GYRO_RAW_Y -- Gyro Y (2s complement 16-bit integer)
         :return:  GYRO_RAW_X as int16_t; GYRO_RAW_Y as int16_t; 
         """
-        addr = 0x56
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_RAW_XY')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_raw_x, gyro_raw_y = struct.unpack('>hh', payload[0:4])
-            return reg, gyro_raw_x, gyro_raw_y
-        else:
-            return None
+        payload = self.read_register(0x56)
+        reg = self.svd_regs_by_name['DREG_GYRO_RAW_XY']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_raw_x, gyro_raw_y = _I16_I16_STRUCT.unpack(payload)
+        return DregGyroRawXy(reg, gyro_raw_x, gyro_raw_y)
 
     @property
     def dreg_gyro_raw_z(self):
@@ -1112,15 +1316,11 @@ class UM7Registers(ABC):
         [31:16] : GYRO_RAW_Z -- Gyro Z (2s complement 16-bit integer)
         :return:  GYRO_RAW_Z as int16_t; 
         """
-        addr = 0x57
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_RAW_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_raw_z = struct.unpack('>hxx', payload[0:4])
-            return reg, gyro_raw_z
-        else:
-            return None
+        payload = self.read_register(0x57)
+        reg = self.svd_regs_by_name['DREG_GYRO_RAW_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_raw_z = _I16_STRUCT.unpack_from(payload)[0]
+        return DregGyroRawZ(reg, gyro_raw_z)
 
     @property
     def dreg_gyro_raw_time(self):
@@ -1130,15 +1330,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_RAW_TIME -- 32-bit IEEE Floating Point Value
         :return:  GYRO_RAW_TIME as float; 
         """
-        addr = 0x58
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_RAW_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_raw_time = struct.unpack('>f', payload[0:4])
-            return reg, gyro_raw_time
-        else:
-            return None
+        payload = self.read_register(0x58)
+        reg = self.svd_regs_by_name['DREG_GYRO_RAW_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_raw_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroRawTime(reg, gyro_raw_time)
 
     @property
     def dreg_accel_raw_xy(self):
@@ -1149,15 +1345,11 @@ class UM7Registers(ABC):
         [15:0]  : ACCEL_RAW_Y -- Accel Y (2s complement 16-bit integer)
         :return:  ACCEL_RAW_X as int16_t; ACCEL_RAW_Y as int16_t; 
         """
-        addr = 0x59
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_RAW_XY')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_raw_x, accel_raw_y = struct.unpack('>hh', payload[0:4])
-            return reg, accel_raw_x, accel_raw_y
-        else:
-            return None
+        payload = self.read_register(0x59)
+        reg = self.svd_regs_by_name['DREG_ACCEL_RAW_XY']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_raw_x, accel_raw_y = _I16_I16_STRUCT.unpack(payload)
+        return DregAccelRawXy(reg, accel_raw_x, accel_raw_y)
 
     @property
     def dreg_accel_raw_z(self):
@@ -1167,15 +1359,11 @@ class UM7Registers(ABC):
         [31:16] : ACCEL_RAW_Z -- Accel Z (2s complement 16-bit integer)
         :return:  ACCEL_RAW_Z as int16_t; 
         """
-        addr = 0x5A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_RAW_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_raw_z = struct.unpack('>hxx', payload[0:4])
-            return reg, accel_raw_z
-        else:
-            return None
+        payload = self.read_register(0x5A)
+        reg = self.svd_regs_by_name['DREG_ACCEL_RAW_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_raw_z = _I16_STRUCT.unpack_from(payload)[0]
+        return DregAccelRawZ(reg, accel_raw_z)
 
     @property
     def dreg_accel_raw_time(self):
@@ -1185,15 +1373,11 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_RAW_TIME -- 32-bit IEEE Floating Point Value
         :return:  ACCEL_RAW_TIME as float; 
         """
-        addr = 0x5B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_RAW_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_raw_time = struct.unpack('>f', payload[0:4])
-            return reg, accel_raw_time
-        else:
-            return None
+        payload = self.read_register(0x5B)
+        reg = self.svd_regs_by_name['DREG_ACCEL_RAW_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_raw_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregAccelRawTime(reg, accel_raw_time)
 
     @property
     def dreg_mag_raw_xy(self):
@@ -1204,15 +1388,11 @@ class UM7Registers(ABC):
         [15:0]  : MAG_RAW_Y -- Magnetometer Y (2s complement 16-bit integer)
         :return:  MAG_RAW_X as int16_t; MAG_RAW_Y as int16_t; 
         """
-        addr = 0x5C
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_RAW_XY')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_raw_x, mag_raw_y = struct.unpack('>hh', payload[0:4])
-            return reg, mag_raw_x, mag_raw_y
-        else:
-            return None
+        payload = self.read_register(0x5C)
+        reg = self.svd_regs_by_name['DREG_MAG_RAW_XY']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_raw_x, mag_raw_y = _I16_I16_STRUCT.unpack(payload)
+        return DregMagRawXy(reg, mag_raw_x, mag_raw_y)
 
     @property
     def dreg_mag_raw_z(self):
@@ -1222,15 +1402,11 @@ class UM7Registers(ABC):
         [31:16] : MAG_RAW_Z -- Magnetometer Z (2s complement 16-bit integer)
         :return:  MAG_RAW_Z as int16_t; 
         """
-        addr = 0x5D
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_RAW_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_raw_z = struct.unpack('>hxx', payload[0:4])
-            return reg, mag_raw_z
-        else:
-            return None
+        payload = self.read_register(0x5D)
+        reg = self.svd_regs_by_name['DREG_MAG_RAW_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_raw_z = _I16_STRUCT.unpack_from(payload)[0]
+        return DregMagRawZ(reg, mag_raw_z)
 
     @property
     def dreg_mag_raw_time(self):
@@ -1240,15 +1416,11 @@ class UM7Registers(ABC):
         [31:0]  : MAG_RAW_TIME -- 32-bit IEEE Floating Point Value
         :return:  MAG_RAW_TIME as float; 
         """
-        addr = 0x5E
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_RAW_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_raw_time = struct.unpack('>f', payload[0:4])
-            return reg, mag_raw_time
-        else:
-            return None
+        payload = self.read_register(0x5E)
+        reg = self.svd_regs_by_name['DREG_MAG_RAW_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_raw_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregMagRawTime(reg, mag_raw_time)
 
     @property
     def dreg_temperature(self):
@@ -1258,15 +1430,11 @@ class UM7Registers(ABC):
         [31:0]  : TEMPERATURE -- Temperature in degrees Celcius (32-bit IEEE Floating Point)
         :return:  TEMPERATURE as float; 
         """
-        addr = 0x5F
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_TEMPERATURE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            temperature = struct.unpack('>f', payload[0:4])
-            return reg, temperature
-        else:
-            return None
+        payload = self.read_register(0x5F)
+        reg = self.svd_regs_by_name['DREG_TEMPERATURE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        temperature = _F32_STRUCT.unpack_from(payload)[0]
+        return DregTemperature(reg, temperature)
 
     @property
     def dreg_temperature_time(self):
@@ -1276,15 +1444,11 @@ class UM7Registers(ABC):
         [31:0]  : TEMPERATURE_TIME -- 32-bit IEEE Floating Point Value
         :return:  TEMPERATURE_TIME as float; 
         """
-        addr = 0x60
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_TEMPERATURE_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            temperature_time = struct.unpack('>f', payload[0:4])
-            return reg, temperature_time
-        else:
-            return None
+        payload = self.read_register(0x60)
+        reg = self.svd_regs_by_name['DREG_TEMPERATURE_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        temperature_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregTemperatureTime(reg, temperature_time)
 
     @property
     def dreg_gyro_proc_x(self):
@@ -1295,15 +1459,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_PROC_X -- Gyro X in degrees / sec (32-bit IEEE Floating Point Value)
         :return:  GYRO_PROC_X as float; 
         """
-        addr = 0x61
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_PROC_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_proc_x = struct.unpack('>f', payload[0:4])
-            return reg, gyro_proc_x
-        else:
-            return None
+        payload = self.read_register(0x61)
+        reg = self.svd_regs_by_name['DREG_GYRO_PROC_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_proc_x = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroProcX(reg, gyro_proc_x)
 
     @property
     def dreg_gyro_proc_y(self):
@@ -1314,15 +1474,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_PROC_Y -- Gyro Y in degrees / sec (32-bit IEEE Floating Point Value)
         :return:  GYRO_PROC_Y as float; 
         """
-        addr = 0x62
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_PROC_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_proc_y = struct.unpack('>f', payload[0:4])
-            return reg, gyro_proc_y
-        else:
-            return None
+        payload = self.read_register(0x62)
+        reg = self.svd_regs_by_name['DREG_GYRO_PROC_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_proc_y = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroProcY(reg, gyro_proc_y)
 
     @property
     def dreg_gyro_proc_z(self):
@@ -1333,15 +1489,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_PROC_Z -- Gyro Z in degrees / sec (32-bit IEEE Floating Point Value)
         :return:  GYRO_PROC_Z as float; 
         """
-        addr = 0x63
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_PROC_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_proc_z = struct.unpack('>f', payload[0:4])
-            return reg, gyro_proc_z
-        else:
-            return None
+        payload = self.read_register(0x63)
+        reg = self.svd_regs_by_name['DREG_GYRO_PROC_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_proc_z = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroProcZ(reg, gyro_proc_z)
 
     @property
     def dreg_gyro_proc_time(self):
@@ -1351,15 +1503,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_PROC_TIME -- Gyro time stamp (32-bit IEEE Floating Point Value)
         :return:  GYRO_PROC_TIME as float; 
         """
-        addr = 0x64
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_PROC_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_proc_time = struct.unpack('>f', payload[0:4])
-            return reg, gyro_proc_time
-        else:
-            return None
+        payload = self.read_register(0x64)
+        reg = self.svd_regs_by_name['DREG_GYRO_PROC_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_proc_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroProcTime(reg, gyro_proc_time)
 
     @property
     def dreg_accel_proc_x(self):
@@ -1370,15 +1518,11 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_PROC_X -- Acceleration X in m/s2 (32-bit IEEE Floating Point Value)
         :return:  ACCEL_PROC_X as float; 
         """
-        addr = 0x65
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_PROC_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_proc_x = struct.unpack('>f', payload[0:4])
-            return reg, accel_proc_x
-        else:
-            return None
+        payload = self.read_register(0x65)
+        reg = self.svd_regs_by_name['DREG_ACCEL_PROC_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_proc_x = _F32_STRUCT.unpack_from(payload)[0]
+        return DregAccelProcX(reg, accel_proc_x)
 
     @property
     def dreg_accel_proc_y(self):
@@ -1389,15 +1533,11 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_PROC_Y -- Acceleration Y in m/s2 (32-bit IEEE Floating Point Value)
         :return:  ACCEL_PROC_Y as float; 
         """
-        addr = 0x66
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_PROC_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_proc_y = struct.unpack('>f', payload[0:4])
-            return reg, accel_proc_y
-        else:
-            return None
+        payload = self.read_register(0x66)
+        reg = self.svd_regs_by_name['DREG_ACCEL_PROC_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_proc_y = _F32_STRUCT.unpack_from(payload)[0]
+        return DregAccelProcY(reg, accel_proc_y)
 
     @property
     def dreg_accel_proc_z(self):
@@ -1408,15 +1548,11 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_PROC_Z -- Acceleration Z in m/s2 (32-bit IEEE Floating Point Value)
         :return:  ACCEL_PROC_Z as float; 
         """
-        addr = 0x67
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_PROC_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_proc_z = struct.unpack('>f', payload[0:4])
-            return reg, accel_proc_z
-        else:
-            return None
+        payload = self.read_register(0x67)
+        reg = self.svd_regs_by_name['DREG_ACCEL_PROC_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_proc_z = _F32_STRUCT.unpack_from(payload)[0]
+        return DregAccelProcZ(reg, accel_proc_z)
 
     @property
     def dreg_accel_proc_time(self):
@@ -1426,15 +1562,11 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_PROC_TIME -- Accelerometer time stamp (32-bit IEEE Floating Point Value)
         :return:  ACCEL_PROC_TIME as float; 
         """
-        addr = 0x68
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_ACCEL_PROC_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_proc_time = struct.unpack('>f', payload[0:4])
-            return reg, accel_proc_time
-        else:
-            return None
+        payload = self.read_register(0x68)
+        reg = self.svd_regs_by_name['DREG_ACCEL_PROC_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_proc_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregAccelProcTime(reg, accel_proc_time)
 
     @property
     def dreg_mag_proc_x(self):
@@ -1445,15 +1577,11 @@ class UM7Registers(ABC):
         [31:0]  : MAG_PROC_X -- Magnetometer X (32-bit IEEE Floating Point Value)
         :return:  MAG_PROC_X as float; 
         """
-        addr = 0x69
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_PROC_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_proc_x = struct.unpack('>f', payload[0:4])
-            return reg, mag_proc_x
-        else:
-            return None
+        payload = self.read_register(0x69)
+        reg = self.svd_regs_by_name['DREG_MAG_PROC_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_proc_x = _F32_STRUCT.unpack_from(payload)[0]
+        return DregMagProcX(reg, mag_proc_x)
 
     @property
     def dreg_mag_proc_y(self):
@@ -1464,15 +1592,11 @@ class UM7Registers(ABC):
         [31:0]  : MAG_PROC_Y -- Magnetometer Y (32-bit IEEE Floating Point Value)
         :return:  MAG_PROC_Y as float; 
         """
-        addr = 0x6A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_PROC_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_proc_y = struct.unpack('>f', payload[0:4])
-            return reg, mag_proc_y
-        else:
-            return None
+        payload = self.read_register(0x6A)
+        reg = self.svd_regs_by_name['DREG_MAG_PROC_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_proc_y = _F32_STRUCT.unpack_from(payload)[0]
+        return DregMagProcY(reg, mag_proc_y)
 
     @property
     def dreg_mag_proc_z(self):
@@ -1483,15 +1607,11 @@ class UM7Registers(ABC):
         [31:0]  : MAG_PROC_Z -- Magnetometer Z (32-bit IEEE Floating Point Value)
         :return:  MAG_PROC_Z as float; 
         """
-        addr = 0x6B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_PROC_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_proc_z = struct.unpack('>f', payload[0:4])
-            return reg, mag_proc_z
-        else:
-            return None
+        payload = self.read_register(0x6B)
+        reg = self.svd_regs_by_name['DREG_MAG_PROC_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_proc_z = _F32_STRUCT.unpack_from(payload)[0]
+        return DregMagProcZ(reg, mag_proc_z)
 
     @property
     def dreg_mag_proc_time(self):
@@ -1501,15 +1621,11 @@ class UM7Registers(ABC):
         [31:0]  : MAG_PROC_TIME -- Magnetometer time stamp (32-bit IEEE Floating Point Value)
         :return:  MAG_PROC_TIME as float; 
         """
-        addr = 0x6C
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_MAG_PROC_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            mag_proc_time = struct.unpack('>f', payload[0:4])
-            return reg, mag_proc_time
-        else:
-            return None
+        payload = self.read_register(0x6C)
+        reg = self.svd_regs_by_name['DREG_MAG_PROC_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        mag_proc_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregMagProcTime(reg, mag_proc_time)
 
     @property
     def dreg_quat_ab(self):
@@ -1520,15 +1636,11 @@ class UM7Registers(ABC):
         [15:0]  : QUAT_B -- Second quaternion component. Stored as a 16-bit signed integer. To get the actual value, divide by 29789.09091.
         :return:  QUAT_A as int16_t; QUAT_B as int16_t; 
         """
-        addr = 0x6D
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_QUAT_AB')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            quat_a, quat_b = struct.unpack('>hh', payload[0:4])
-            return reg, quat_a, quat_b
-        else:
-            return None
+        payload = self.read_register(0x6D)
+        reg = self.svd_regs_by_name['DREG_QUAT_AB']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        quat_a, quat_b = _I16_I16_STRUCT.unpack(payload)
+        return DregQuatAb(reg, quat_a, quat_b)
 
     @property
     def dreg_quat_cd(self):
@@ -1539,15 +1651,11 @@ class UM7Registers(ABC):
         [15:0]  : QUAT_D -- Fourth quaternion component. Stored as a 16-bit signed integer. To get the actual value, divide by 29789.09091.
         :return:  QUAT_C as int16_t; QUAT_D as int16_t; 
         """
-        addr = 0x6E
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_QUAT_CD')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            quat_c, quat_d = struct.unpack('>hh', payload[0:4])
-            return reg, quat_c, quat_d
-        else:
-            return None
+        payload = self.read_register(0x6E)
+        reg = self.svd_regs_by_name['DREG_QUAT_CD']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        quat_c, quat_d = _I16_I16_STRUCT.unpack(payload)
+        return DregQuatCd(reg, quat_c, quat_d)
 
     @property
     def dreg_quat_time(self):
@@ -1557,15 +1665,11 @@ class UM7Registers(ABC):
         [31:0]  : QUAT_TIME -- Quaternion time (32-bit IEEE Floating Point Value)
         :return:  QUAT_TIME as float; 
         """
-        addr = 0x6F
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_QUAT_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            quat_time = struct.unpack('>f', payload[0:4])
-            return reg, quat_time
-        else:
-            return None
+        payload = self.read_register(0x6F)
+        reg = self.svd_regs_by_name['DREG_QUAT_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        quat_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregQuatTime(reg, quat_time)
 
     @property
     def dreg_euler_phi_theta(self):
@@ -1576,15 +1680,11 @@ class UM7Registers(ABC):
         [15:0]  : THETA -- Pitch angle. Stored as a 16-bit signed integer. To get the actual value, divide by 91.02222.
         :return:  PHI as int16_t; THETA as int16_t; 
         """
-        addr = 0x70
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_EULER_PHI_THETA')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            phi, theta = struct.unpack('>hh', payload[0:4])
-            return reg, phi, theta
-        else:
-            return None
+        payload = self.read_register(0x70)
+        reg = self.svd_regs_by_name['DREG_EULER_PHI_THETA']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        phi, theta = _I16_I16_STRUCT.unpack(payload)
+        return DregEulerPhiTheta(reg, phi, theta)
 
     @property
     def dreg_euler_psi(self):
@@ -1594,15 +1694,11 @@ class UM7Registers(ABC):
         [31:16] : PSI -- Yaw angle. Stored as a 16-bit signed integer. To get the actual value, divide by 91.02222.
         :return:  PSI as int16_t; 
         """
-        addr = 0x71
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_EULER_PSI')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            psi = struct.unpack('>hxx', payload[0:4])
-            return reg, psi
-        else:
-            return None
+        payload = self.read_register(0x71)
+        reg = self.svd_regs_by_name['DREG_EULER_PSI']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        psi = _I16_STRUCT.unpack_from(payload)[0]
+        return DregEulerPsi(reg, psi)
 
     @property
     def dreg_euler_phi_theta_dot(self):
@@ -1613,15 +1709,11 @@ class UM7Registers(ABC):
         [15:0]  : THETA_DOT -- Pitch rate. Stored as a 16-bit signed integer. To get the actual value, divide by 16.0.
         :return:  PHI_DOT as int16_t; THETA_DOT as int16_t; 
         """
-        addr = 0x72
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_EULER_PHI_THETA_DOT')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            phi_dot, theta_dot = struct.unpack('>hh', payload[0:4])
-            return reg, phi_dot, theta_dot
-        else:
-            return None
+        payload = self.read_register(0x72)
+        reg = self.svd_regs_by_name['DREG_EULER_PHI_THETA_DOT']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        phi_dot, theta_dot = _I16_I16_STRUCT.unpack(payload)
+        return DregEulerPhiThetaDot(reg, phi_dot, theta_dot)
 
     @property
     def dreg_euler_psi_dot(self):
@@ -1631,15 +1723,11 @@ class UM7Registers(ABC):
         [31:16] : PSI_DOT -- Yaw rate. Stored as a 16-bit signed integer. To get the actual value, divide by 16.0.
         :return:  PSI_DOT as int16_t; 
         """
-        addr = 0x73
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_EULER_PSI_DOT')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            psi_dot = struct.unpack('>hxx', payload[0:4])
-            return reg, psi_dot
-        else:
-            return None
+        payload = self.read_register(0x73)
+        reg = self.svd_regs_by_name['DREG_EULER_PSI_DOT']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        psi_dot = _I16_STRUCT.unpack_from(payload)[0]
+        return DregEulerPsiDot(reg, psi_dot)
 
     @property
     def dreg_euler_time(self):
@@ -1649,15 +1737,11 @@ class UM7Registers(ABC):
         [31:0]  : EULER_TIME -- Euler time (32-bit IEEE Floating Point Value)
         :return:  EULER_TIME as float; 
         """
-        addr = 0x74
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_EULER_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            euler_time = struct.unpack('>f', payload[0:4])
-            return reg, euler_time
-        else:
-            return None
+        payload = self.read_register(0x74)
+        reg = self.svd_regs_by_name['DREG_EULER_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        euler_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregEulerTime(reg, euler_time)
 
     @property
     def dreg_position_north(self):
@@ -1667,15 +1751,11 @@ class UM7Registers(ABC):
         [31:0]  : POSITION_NORTH -- North Position (32-bit IEEE Floating Point Value)
         :return:  POSITION_NORTH as float; 
         """
-        addr = 0x75
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_POSITION_NORTH')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            position_north = struct.unpack('>f', payload[0:4])
-            return reg, position_north
-        else:
-            return None
+        payload = self.read_register(0x75)
+        reg = self.svd_regs_by_name['DREG_POSITION_NORTH']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        position_north = _F32_STRUCT.unpack_from(payload)[0]
+        return DregPositionNorth(reg, position_north)
 
     @property
     def dreg_position_east(self):
@@ -1685,15 +1765,11 @@ class UM7Registers(ABC):
         [31:0]  : POSITION_EAST -- East Position (32-bit IEEE Floating Point Value)
         :return:  POSITION_EAST as float; 
         """
-        addr = 0x76
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_POSITION_EAST')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            position_east = struct.unpack('>f', payload[0:4])
-            return reg, position_east
-        else:
-            return None
+        payload = self.read_register(0x76)
+        reg = self.svd_regs_by_name['DREG_POSITION_EAST']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        position_east = _F32_STRUCT.unpack_from(payload)[0]
+        return DregPositionEast(reg, position_east)
 
     @property
     def dreg_position_up(self):
@@ -1703,15 +1779,11 @@ class UM7Registers(ABC):
         [31:0]  : POSITION_UP -- Altitude (32-bit IEEE Floating Point Value)
         :return:  POSITION_UP as float; 
         """
-        addr = 0x77
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_POSITION_UP')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            position_up = struct.unpack('>f', payload[0:4])
-            return reg, position_up
-        else:
-            return None
+        payload = self.read_register(0x77)
+        reg = self.svd_regs_by_name['DREG_POSITION_UP']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        position_up = _F32_STRUCT.unpack_from(payload)[0]
+        return DregPositionUp(reg, position_up)
 
     @property
     def dreg_position_time(self):
@@ -1721,15 +1793,11 @@ class UM7Registers(ABC):
         [31:0]  : POSITION_TIME -- Position Time (32-bit IEEE Floating Point Value)
         :return:  POSITION_TIME as float; 
         """
-        addr = 0x78
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_POSITION_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            position_time = struct.unpack('>f', payload[0:4])
-            return reg, position_time
-        else:
-            return None
+        payload = self.read_register(0x78)
+        reg = self.svd_regs_by_name['DREG_POSITION_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        position_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregPositionTime(reg, position_time)
 
     @property
     def dreg_velocity_north(self):
@@ -1739,15 +1807,11 @@ class UM7Registers(ABC):
         [31:0]  : VELOCITY_NORTH -- North Velocity (32-bit IEEE Floating Point Value)
         :return:  VELOCITY_NORTH as float; 
         """
-        addr = 0x79
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_VELOCITY_NORTH')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            velocity_north = struct.unpack('>f', payload[0:4])
-            return reg, velocity_north
-        else:
-            return None
+        payload = self.read_register(0x79)
+        reg = self.svd_regs_by_name['DREG_VELOCITY_NORTH']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        velocity_north = _F32_STRUCT.unpack_from(payload)[0]
+        return DregVelocityNorth(reg, velocity_north)
 
     @property
     def dreg_velocity_east(self):
@@ -1757,15 +1821,11 @@ class UM7Registers(ABC):
         [31:0]  : VELOCITY_EAST -- East Velocity (32-bit IEEE Floating Point Value)
         :return:  VELOCITY_EAST as float; 
         """
-        addr = 0x7A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_VELOCITY_EAST')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            velocity_east = struct.unpack('>f', payload[0:4])
-            return reg, velocity_east
-        else:
-            return None
+        payload = self.read_register(0x7A)
+        reg = self.svd_regs_by_name['DREG_VELOCITY_EAST']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        velocity_east = _F32_STRUCT.unpack_from(payload)[0]
+        return DregVelocityEast(reg, velocity_east)
 
     @property
     def dreg_velocity_up(self):
@@ -1775,15 +1835,11 @@ class UM7Registers(ABC):
         [31:0]  : VELOCITY_UP -- Altitude Velocity (32-bit IEEE Floating Point Value)
         :return:  VELOCITY_UP as float; 
         """
-        addr = 0x7B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_VELOCITY_UP')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            velocity_up = struct.unpack('>f', payload[0:4])
-            return reg, velocity_up
-        else:
-            return None
+        payload = self.read_register(0x7B)
+        reg = self.svd_regs_by_name['DREG_VELOCITY_UP']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        velocity_up = _F32_STRUCT.unpack_from(payload)[0]
+        return DregVelocityUp(reg, velocity_up)
 
     @property
     def dreg_velocity_time(self):
@@ -1793,15 +1849,11 @@ class UM7Registers(ABC):
         [31:0]  : VELOCITY_TIME -- Velocity time (32-bit IEEE Floating Point Value)
         :return:  VELOCITY_TIME as float; 
         """
-        addr = 0x7C
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_VELOCITY_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            velocity_time = struct.unpack('>f', payload[0:4])
-            return reg, velocity_time
-        else:
-            return None
+        payload = self.read_register(0x7C)
+        reg = self.svd_regs_by_name['DREG_VELOCITY_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        velocity_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregVelocityTime(reg, velocity_time)
 
     @property
     def dreg_gps_latitude(self):
@@ -1811,15 +1863,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_LATITUDE -- GPS Latitude (32-bit IEEE Floating Point Value)
         :return:  GPS_LATITUDE as float; 
         """
-        addr = 0x7D
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_LATITUDE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_latitude = struct.unpack('>f', payload[0:4])
-            return reg, gps_latitude
-        else:
-            return None
+        payload = self.read_register(0x7D)
+        reg = self.svd_regs_by_name['DREG_GPS_LATITUDE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_latitude = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsLatitude(reg, gps_latitude)
 
     @property
     def dreg_gps_longitude(self):
@@ -1829,15 +1877,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_LONGITUDE -- GPS Longitude (32-bit IEEE Floating Point Value)
         :return:  GPS_LONGITUDE as float; 
         """
-        addr = 0x7E
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_LONGITUDE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_longitude = struct.unpack('>f', payload[0:4])
-            return reg, gps_longitude
-        else:
-            return None
+        payload = self.read_register(0x7E)
+        reg = self.svd_regs_by_name['DREG_GPS_LONGITUDE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_longitude = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsLongitude(reg, gps_longitude)
 
     @property
     def dreg_gps_altitude(self):
@@ -1847,15 +1891,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_ALTITUDE -- GPS Altitude (32-bit IEEE Floating Point Value)
         :return:  GPS_ALTITUDE as float; 
         """
-        addr = 0x7F
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_ALTITUDE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_altitude = struct.unpack('>f', payload[0:4])
-            return reg, gps_altitude
-        else:
-            return None
+        payload = self.read_register(0x7F)
+        reg = self.svd_regs_by_name['DREG_GPS_ALTITUDE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_altitude = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsAltitude(reg, gps_altitude)
 
     @property
     def dreg_gps_course(self):
@@ -1865,15 +1905,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_COURSE -- GPS Course (32-bit IEEE Floating Point Value)
         :return:  GPS_COURSE as float; 
         """
-        addr = 0x80
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_COURSE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_course = struct.unpack('>f', payload[0:4])
-            return reg, gps_course
-        else:
-            return None
+        payload = self.read_register(0x80)
+        reg = self.svd_regs_by_name['DREG_GPS_COURSE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_course = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsCourse(reg, gps_course)
 
     @property
     def dreg_gps_speed(self):
@@ -1883,15 +1919,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_SPEED -- GPS Speed (32-bit IEEE Floating Point Value)
         :return:  GPS_SPEED as float; 
         """
-        addr = 0x81
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SPEED')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_speed = struct.unpack('>f', payload[0:4])
-            return reg, gps_speed
-        else:
-            return None
+        payload = self.read_register(0x81)
+        reg = self.svd_regs_by_name['DREG_GPS_SPEED']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_speed = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsSpeed(reg, gps_speed)
 
     @property
     def dreg_gps_time(self):
@@ -1901,15 +1933,11 @@ class UM7Registers(ABC):
         [31:0]  : GPS_TIME -- GPS Speed (32-bit IEEE Floating Point Value)
         :return:  GPS_TIME as float; 
         """
-        addr = 0x82
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_TIME')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gps_time = struct.unpack('>f', payload[0:4])
-            return reg, gps_time
-        else:
-            return None
+        payload = self.read_register(0x82)
+        reg = self.svd_regs_by_name['DREG_GPS_TIME']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gps_time = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGpsTime(reg, gps_time)
 
     @property
     def dreg_gps_sat_1_2(self):
@@ -1922,15 +1950,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_2_SNR -- Signal-to-Noise Ratio of satellite 2 as reported by GPS receiver.
         :return:  SAT_1_ID as uint8_t; SAT_1_SNR as uint8_t; SAT_2_ID as uint8_t; SAT_2_SNR as uint8_t; 
         """
-        addr = 0x83
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_1_2')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_1_id, sat_1_snr, sat_2_id, sat_2_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_1_id, sat_1_snr, sat_2_id, sat_2_snr
-        else:
-            return None
+        payload = self.read_register(0x83)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_1_2']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_1_id, sat_1_snr, sat_2_id, sat_2_snr = payload
+        return DregGpsSat12(reg, sat_1_id, sat_1_snr, sat_2_id, sat_2_snr)
 
     @property
     def dreg_gps_sat_3_4(self):
@@ -1943,15 +1967,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_4_SNR -- Signal-to-Noise Ratio of satellite 4 as reported by GPS receiver.
         :return:  SAT_3_ID as uint8_t; SAT_3_SNR as uint8_t; SAT_4_ID as uint8_t; SAT_4_SNR as uint8_t; 
         """
-        addr = 0x84
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_3_4')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_3_id, sat_3_snr, sat_4_id, sat_4_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_3_id, sat_3_snr, sat_4_id, sat_4_snr
-        else:
-            return None
+        payload = self.read_register(0x84)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_3_4']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_3_id, sat_3_snr, sat_4_id, sat_4_snr = payload
+        return DregGpsSat34(reg, sat_3_id, sat_3_snr, sat_4_id, sat_4_snr)
 
     @property
     def dreg_gps_sat_5_6(self):
@@ -1964,15 +1984,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_6_SNR -- Signal-to-Noise Ratio of satellite 6 as reported by GPS receiver.
         :return:  SAT_5_ID as uint8_t; SAT_5_SNR as uint8_t; SAT_6_ID as uint8_t; SAT_6_SNR as uint8_t; 
         """
-        addr = 0x85
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_5_6')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_5_id, sat_5_snr, sat_6_id, sat_6_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_5_id, sat_5_snr, sat_6_id, sat_6_snr
-        else:
-            return None
+        payload = self.read_register(0x85)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_5_6']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_5_id, sat_5_snr, sat_6_id, sat_6_snr = payload
+        return DregGpsSat56(reg, sat_5_id, sat_5_snr, sat_6_id, sat_6_snr)
 
     @property
     def dreg_gps_sat_7_8(self):
@@ -1985,15 +2001,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_8_SNR -- Signal-to-Noise Ratio of satellite 8 as reported by GPS receiver.
         :return:  SAT_7_ID as uint8_t; SAT_7_SNR as uint8_t; SAT_8_ID as uint8_t; SAT_8_SNR as uint8_t; 
         """
-        addr = 0x86
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_7_8')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_7_id, sat_7_snr, sat_8_id, sat_8_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_7_id, sat_7_snr, sat_8_id, sat_8_snr
-        else:
-            return None
+        payload = self.read_register(0x86)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_7_8']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_7_id, sat_7_snr, sat_8_id, sat_8_snr = payload
+        return DregGpsSat78(reg, sat_7_id, sat_7_snr, sat_8_id, sat_8_snr)
 
     @property
     def dreg_gps_sat_9_10(self):
@@ -2006,15 +2018,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_10_SNR -- Signal-to-Noise Ratio of satellite 10 as reported by GPS receiver.
         :return:  SAT_9_ID as uint8_t; SAT_9_SNR as uint8_t; SAT_10_ID as uint8_t; SAT_10_SNR as uint8_t; 
         """
-        addr = 0x87
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_9_10')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_9_id, sat_9_snr, sat_10_id, sat_10_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_9_id, sat_9_snr, sat_10_id, sat_10_snr
-        else:
-            return None
+        payload = self.read_register(0x87)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_9_10']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_9_id, sat_9_snr, sat_10_id, sat_10_snr = payload
+        return DregGpsSat910(reg, sat_9_id, sat_9_snr, sat_10_id, sat_10_snr)
 
     @property
     def dreg_gps_sat_11_12(self):
@@ -2027,15 +2035,11 @@ class UM7Registers(ABC):
         [7:0]   : SAT_12_SNR -- Signal-to-Noise Ratio of satellite 12 as reported by GPS receiver.
         :return:  SAT_11_ID as uint8_t; SAT_11_SNR as uint8_t; SAT_12_ID as uint8_t; SAT_12_SNR as uint8_t; 
         """
-        addr = 0x88
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GPS_SAT_11_12')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            sat_11_id, sat_11_snr, sat_12_id, sat_12_snr = struct.unpack('>BBBB', payload[0:4])
-            return reg, sat_11_id, sat_11_snr, sat_12_id, sat_12_snr
-        else:
-            return None
+        payload = self.read_register(0x88)
+        reg = self.svd_regs_by_name['DREG_GPS_SAT_11_12']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        sat_11_id, sat_11_snr, sat_12_id, sat_12_snr = payload
+        return DregGpsSat1112(reg, sat_11_id, sat_11_snr, sat_12_id, sat_12_snr)
 
     @property
     def dreg_gyro_bias_x(self):
@@ -2045,15 +2049,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_BIAS_X -- Gyro bias X (32-bit IEEE Floating Point Value)
         :return:  GYRO_BIAS_X as float; 
         """
-        addr = 0x89
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_BIAS_X')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_bias_x = struct.unpack('>f', payload[0:4])
-            return reg, gyro_bias_x
-        else:
-            return None
+        payload = self.read_register(0x89)
+        reg = self.svd_regs_by_name['DREG_GYRO_BIAS_X']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_bias_x = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroBiasX(reg, gyro_bias_x)
 
     @property
     def dreg_gyro_bias_y(self):
@@ -2063,15 +2063,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_BIAS_Y -- Gyro bias Y (32-bit IEEE Floating Point Value)
         :return:  GYRO_BIAS_Y as float; 
         """
-        addr = 0x8A
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_BIAS_Y')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_bias_y = struct.unpack('>f', payload[0:4])
-            return reg, gyro_bias_y
-        else:
-            return None
+        payload = self.read_register(0x8A)
+        reg = self.svd_regs_by_name['DREG_GYRO_BIAS_Y']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_bias_y = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroBiasY(reg, gyro_bias_y)
 
     @property
     def dreg_gyro_bias_z(self):
@@ -2081,15 +2077,11 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_BIAS_Z -- Gyro bias Z (32-bit IEEE Floating Point Value)
         :return:  GYRO_BIAS_Z as float; 
         """
-        addr = 0x8B
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='DREG_GYRO_BIAS_Z')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_bias_z = struct.unpack('>f', payload[0:4])
-            return reg, gyro_bias_z
-        else:
-            return None
+        payload = self.read_register(0x8B)
+        reg = self.svd_regs_by_name['DREG_GYRO_BIAS_Z']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_bias_z = _F32_STRUCT.unpack_from(payload)[0]
+        return DregGyroBiasZ(reg, gyro_bias_z)
 
     @property
     def get_fw_revision(self):
@@ -2100,78 +2092,56 @@ class UM7Registers(ABC):
         [31:0]  : FW_REVISION -- Firmware revision string
         :return:  FW_REVISION as string; 
         """
-        addr = 0xAA
-        ok, payload = self.read_register(addr)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='GET_FW_REVISION')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            fw_revision = struct.unpack('>4s', payload[0:4])[0].decode('utf-8')
-            return fw_revision
-        else:
-            return None
+        payload = self.read_register(0xAA)
+        reg = self.svd_regs_by_name['GET_FW_REVISION']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        fw_revision = bytes(payload).decode('ascii')
+        return fw_revision
 
-    @property
-    def flash_commit(self):
-        raise RuntimeError('flash_commit has no getter! The register flash_commit is write-only!')
-
-    @flash_commit.setter
-    def flash_commit(self, new_value):
-        addr = 0xAB
-        self.write_register(addr, new_value)
-
-    @property
-    def reset_to_factory(self):
-        raise RuntimeError('reset_to_factory has no getter! The register reset_to_factory is write-only!')
-
-    @reset_to_factory.setter
-    def reset_to_factory(self, new_value):
-        addr = 0xAC
-        self.write_register(addr, new_value)
-
-    @property
-    def zero_gyros(self):
-        raise RuntimeError('zero_gyros has no getter! The register zero_gyros is write-only!')
-
-    @zero_gyros.setter
-    def zero_gyros(self, new_value):
-        addr = 0xAD
-        self.write_register(addr, new_value)
-
-    @property
-    def set_home_position(self):
-        raise RuntimeError('set_home_position has no getter! The register set_home_position is write-only!')
-
-    @set_home_position.setter
-    def set_home_position(self, new_value):
-        addr = 0xAE
-        self.write_register(addr, new_value)
+    def flash_commit(self, new_value: int = 1) -> bool:
+        """
+        Causes the board to write all configuration settings to FLASH so that are stored in the non-volatile memory
+        and remain when the power is cycled.
+        """
+        return self.write_register(0xAB, new_value)
 
-    @property
-    def set_mag_reference(self):
-        raise RuntimeError('set_mag_reference has no getter! The register set_mag_reference is write-only!')
+    def reset_to_factory(self, new_value: int = 1) -> bool:
+        """
+        Causes the board to load default factory settings.
+        """
+        return self.write_register(0xAC, new_value)
 
-    @set_mag_reference.setter
-    def set_mag_reference(self, new_value):
-        addr = 0xB0
-        self.write_register(addr, new_value)
+    def zero_gyros(self, new_value: int = 1) -> bool:
+        """
+        Causes the board to measure the gyro outputs and set the output trim registers to compensate for any non-zero
+        bias. The board should be kept stationary while the zero operation is underway.
+        """
+        return self.write_register(0xAD, new_value)
 
-    @property
-    def calibrate_accelerometers(self):
-        raise RuntimeError('calibrate_accelerometers has no getter! The register calibrate_accelerometers is write-only!')
+    def set_home_position(self, new_value: int = 1) -> bool:
+        """
+        Sets the current GPS latitude, longitude, and altitude as the home position. All future positions will be
+        referenced to the current GPS position.
+        """
+        return self.write_register(0xAE, new_value)
 
-    @calibrate_accelerometers.setter
-    def calibrate_accelerometers(self, new_value):
-        addr = 0xB1
-        self.write_register(addr, new_value)
+    def set_mag_reference(self, new_value: int = 1) -> bool:
+        """
+        Sets the current yaw heading position as north.
+        """
+        return self.write_register(0xB0, new_value)
 
-    @property
-    def reset_ekf(self):
-        raise RuntimeError('reset_ekf has no getter! The register reset_ekf is write-only!')
+    def calibrate_accelerometers(self, new_value: int = 1) -> bool:
+        """
+        Reboots the board and performs a crude calibration on the accelerometers. Best performed on a flat surface.
+        """
+        return self.write_register(0xB1, new_value)
 
-    @reset_ekf.setter
-    def reset_ekf(self, new_value):
-        addr = 0xB3
-        self.write_register(addr, new_value)
+    def reset_ekf(self, new_value: int = 1) -> bool:
+        """
+        Resets the EKF sensor fusion algorithm.
+        """
+        return self.write_register(0xB3, new_value)
 
 
     @property
@@ -2182,20 +2152,15 @@ class UM7Registers(ABC):
         [31:0]  : GYRO_VARIANCE -- Gyro variance for EKF
         :return:  GYRO_VARIANCE as float; 
         """
-        addr = 0x00
-        ok, payload = self.read_register(addr, hidden=True)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='HIDDEN_GYRO_VARIANCE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            gyro_variance = struct.unpack('>f', payload[0:4])
-            return reg, gyro_variance
-        else:
-            return None
+        payload = self.read_register(0x00, hidden=True)
+        reg = self.svd_regs_by_name['HIDDEN_GYRO_VARIANCE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        gyro_variance = _F32_STRUCT.unpack_from(payload)[0]
+        return HiddenGyroVariance(reg, gyro_variance)
 
     @hidden_gyro_variance.setter
     def hidden_gyro_variance(self, new_value):
-        addr = 0x00
-        self.write_register(addr, new_value, hidden=True)
+        self.write_register(0x00, new_value, hidden=True)
 
     @property
     def hidden_accel_variance(self):
@@ -2205,20 +2170,15 @@ class UM7Registers(ABC):
         [31:0]  : ACCEL_VARIANCE -- Accelerometer variance IEEE floating point value.
         :return:  ACCEL_VARIANCE as float; 
         """
-        addr = 0x01
-        ok, payload = self.read_register(addr, hidden=True)
-        if ok:
-            reg = self.svd_parser.find_register_by(name='HIDDEN_ACCEL_VARIANCE')
-            reg.raw_value, = struct.unpack('>I', payload[0:4])
-            accel_variance = struct.unpack('>f', payload[0:4])
-            return reg, accel_variance
-        else:
-            return None
+        payload = self.read_register(0x01, hidden=True)
+        reg = self.svd_regs_by_name['HIDDEN_ACCEL_VARIANCE']
+        reg.raw_value = int.from_bytes(payload, 'big')
+        accel_variance = _F32_STRUCT.unpack_from(payload)[0]
+        return HiddenAccelVariance(reg, accel_variance)
 
     @hidden_accel_variance.setter
     def hidden_accel_variance(self, new_value):
-        addr = 0x01
-        self.write_register(addr, new_value, hidden=True)
+        self.write_register(0x01, new_value, hidden=True)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@
 # Version: v0.2
 # License: MIT
 
+import asyncio
 import json
 import logging
 import os
@@ -18,14 +19,43 @@ from typing import Tuple, List, Dict, Any, Union, Callable
 from um7py.um7_broadcast_packets import UM7AllRawPacket, UM7HealthPacket, UM7GyroBiasPacket, UM7ProcMagPacket, \
     UM7ProcGyroPacket, UM7ProcAccelPacket, UM7RawMagPacket, UM7RawGyroPacket, UM7RawAccelPacket, UM7QuaternionPacket, \
     UM7EulerPacket, UM7AllProcPacket
-from um7py.um7_registers import UM7Registers
-
-
-class RslException(Exception):
-    """
-    RSL Exception class for recording RedShiftLabs and/or UM7 specific errors
-    """
-    pass
+from um7py.rsl_exceptions import RslException, RegisterReadError
+from um7py.rsl_register_cache import RegisterCache
+from um7py.um7_registers import UM7Registers, _QUAT_SCALE, _EULER_SCALE, _EULER_RATE_SCALE
+
+UM7_PREAMBLE = b'snp'
+# preamble, packet type and address
+_HEADER_STRUCT = struct.Struct('>3sBB')
+_CHECKSUM_STRUCT = struct.Struct('>H')
+# packet type byte -> (has_data, is_batch, batch_length, hidden, command_failed)
+_PACKET_TYPES = tuple((bool(packet_type >> 7 & 0x01), bool(packet_type >> 6 & 0x01), packet_type >> 2 & 0x0F,
+                       bool(packet_type >> 1 & 0x01), bool(packet_type & 0x01)) for packet_type in range(256))
+# packet type byte -> length of a valid packet of this type, 0 when the command failed bit is set
+_CHECKED_PACKET_LENGTHS = tuple(0 if packet_type & 0x01 else 7 if not packet_type & 0x80 else
+                                7 + 4 * ((packet_type >> 2 & 0x0F) or 1) for packet_type in range(256))
+# register payload by type of the written value
+_REGISTER_ENCODERS = {
+    int: struct.Struct('>I').pack,
+    bool: struct.Struct('>I').pack,
+    float: struct.Struct('>f').pack,
+    bytes: bytes,
+    bytearray: bytes,
+}
+# broadcast payloads start at offset 5 of a packet, the structs are unpacked from the packet without slicing it
+# raw x, y, z with padding and time stamp
+_RAW_VECTOR_STRUCT = struct.Struct('>hhhxxf')
+# processed x, y, z and time stamp
+_PROC_VECTOR_STRUCT = struct.Struct('>ffff')
+# raw gyro, accel, mag, each with time stamp, temperature with time stamp
+_ALL_RAW_STRUCT = struct.Struct('>hhhxxfhhhxxfhhhxxfff')
+# processed gyro, accel, mag, each with time stamp
+_ALL_PROC_STRUCT = struct.Struct('>ffffffffffff')
+# roll, pitch, yaw with padding, roll, pitch, yaw rates with padding, time stamp
+_EULER_STRUCT = struct.Struct('>hhhxxhhhxxf')
+# quaternion w, x, y, z, time stamp
+_QUAT_STRUCT = struct.Struct('>hhhhf')
+_GYRO_BIAS_STRUCT = struct.Struct('>fff')
+_HEALTH_STRUCT = struct.Struct('>I')
 
 
 class UM7Serial(UM7Registers):
@@ -36,10 +66,17 @@ class UM7Serial(UM7Registers):
         self.port = serial.Serial()
         self.port_name = None
         self.port_config = None
-        self.buffer = bytes()
+        # received data is appended in place, a bytes buffer would be copied on every read
+        self.buffer = bytearray()
         self.buffer_size = 125
         self.firmware_version = None
         self.uid_32_bit = None
+        self.read_packets = {}
+        self.write_headers = {}
+        self.init_packet_templates()
+        self.register_cache = RegisterCache(kwargs.get('cache_ttl', 0.005))
+        # serializes async reads sharing the port, created in the running event loop on first use
+        self.async_lock = None
         if kwargs.get('port_name') is not None:
             self.port_name = kwargs.get('port_name')
         else:
@@ -52,12 +89,27 @@ class UM7Serial(UM7Registers):
         self.port = serial.Serial(port=self.port_name)
         self.port.port = self.port_name
         self.port.baudrate = 115200
+        # reads with a deadline block for at most this long when the sensor is silent
+        self.port.timeout = 0.01
         if not self.port.is_open:
             self.port.open()
+        if hasattr(self.port, 'set_buffer_size'):
+            # only available on Windows, where the default driver buffer of 4 KiB overflows on fast broadcasts
+            self.port.set_buffer_size(rx_size=65536)
 
     def connect(self, *args, **kwargs):
         self.init_connection()
 
+    def init_packet_templates(self):
+        # read requests and write packet headers do not depend on register values, build them once per address
+        for reg_addr in range(256):
+            for hidden in (False, True):
+                read_type = self.construct_packet_type(hidden=hidden)
+                self.read_packets[reg_addr, hidden] = self.construct_packet(read_type, reg_addr)
+                write_type = self.construct_packet_type(has_data=True, hidden=hidden)
+                write_header = _HEADER_STRUCT.pack(UM7_PREAMBLE, write_type, reg_addr)
+                self.write_headers[reg_addr, hidden] = write_header, sum(write_header)
+
     def find_port(self):
         if not self.device_file:
             raise RslException("No configuration file specified!")
@@ -91,26 +143,22 @@ class UM7Serial(UM7Registers):
         else:
             import pyudev
             context = pyudev.Context()
+            # config keys and values in a fixed order, each device is compared by a tuple without building a dict
+            device_keys = tuple(self.device_dict)
+            device_values = tuple(self.device_dict.values())
             for device in context.list_devices(subsystem='tty'):
-                json_config = {}
                 if device.get('ID_VENDOR') == 'FTDI':
-                    for key in self.device_dict:
-                        json_config[key] = device.get(key)
-                    if self.device_dict == json_config:
+                    if tuple(device.get(key) for key in device_keys) == device_values:
                         self.port_name = device.device_node
                         return True
             else:
                 return False
 
     def get_preamble(self):
-        preamble = bytes('snp', encoding='ascii')
-        return preamble
+        return UM7_PREAMBLE
 
     def compute_checksum(self, partial_packet: bytes) -> bytes:
-        checksum = 0
-        for byte in partial_packet:
-            checksum += byte
-        checksum_bytes = int.to_bytes(checksum, length=2, byteorder='big', signed=False)
+        checksum_bytes = _CHECKSUM_STRUCT.pack(sum(partial_packet))
         return checksum_bytes
 
     def construct_packet_type(self, has_data: bool = False, is_batch: bool = False, data_length: int = 0,
@@ -121,18 +169,10 @@ class UM7Serial(UM7Registers):
         return packet_type
 
     def get_packet_type(self, extracted_packet_type: int) -> Tuple[bool, bool, int, bool, bool]:
-        has_data = bool(extracted_packet_type >> 7 & 0x01)
-        is_batch = bool(extracted_packet_type >> 6 & 0x01)
-        batch_length = extracted_packet_type >> 2 & 0x0F
-        hidden = bool(extracted_packet_type >> 1 & 0x01)
-        command_failed = bool(extracted_packet_type & 0x01)
-        return has_data, is_batch, batch_length, hidden, command_failed
+        return _PACKET_TYPES[extracted_packet_type]
 
     def construct_packet(self, packet_type: int, address: int, payload: bytes = bytes()) -> bytes:
-        preamble = self.get_preamble()
-        packet_type_byte = int.to_bytes(packet_type, length=1, byteorder='big')
-        address_byte = int.to_bytes(address, length=1, byteorder='big')
-        partial_packet = preamble + packet_type_byte + address_byte + payload
+        partial_packet = _HEADER_STRUCT.pack(UM7_PREAMBLE, packet_type, address) + payload
         checksum = self.compute_checksum(partial_packet)
         packet = partial_packet + checksum
         return packet
@@ -142,25 +182,29 @@ class UM7Serial(UM7Registers):
         self.port.flush()
         return bytes_written == len(packet)
 
-    def recv(self) -> Tuple[bool, bytes]:
-        ok = False
-        while not ok:
+    def recv(self, deadline: float = None) -> Tuple[bool, bytes]:
+        while True:
             # read until we get something in the buffer
             in_waiting = self.port.in_waiting
-            logging.info(f"waiting buffer: {in_waiting}")
-            self.buffer += self.port.read(self.buffer_size)
+            logging.debug("waiting buffer: %d", in_waiting)
+            # bytes already waiting are read in one call, with a deadline at least one byte is awaited
+            # for the port timeout, so a silent sensor neither blocks the call nor makes the caller spin
+            read_size = max(in_waiting, self.buffer_size) if deadline is None else max(1, in_waiting)
+            self.buffer += self.port.read(read_size)
             # self.buffer += self.port.read(in_waiting)
-            logging.info(f"buffer size: {len(self.buffer)}")
+            logging.debug("buffer size: %d", len(self.buffer))
             # self.__buffer = self.__port.read(self.__port.inWaiting()) # causes too long of a delay
-            ok = len(self.buffer) > 0
-        return True, self.buffer
+            if len(self.buffer) > 0:
+                return True, self.buffer
+            if deadline is not None and monotonic() >= deadline:
+                return False, self.buffer
 
-    def send_recv(self, packet: bytes) -> bytes:
+    def send_recv(self, packet: bytes, deadline: float = None) -> bytes:
         send_ok = self.send(packet)
         if not send_ok:
             raise RslException("Sending packet failed!")
-        recv_ok, _ = self.recv()
-        if not recv_ok:
+        recv_ok, _ = self.recv(deadline)
+        if not recv_ok and deadline is None:
             raise RslException("Receiving packet failed!")
         return self.buffer
 
@@ -170,56 +214,89 @@ class UM7Serial(UM7Registers):
 
         if packet_start_idx == -1:
             # preamble of packet not found, exit
-            return bytes(), bytes()
+            return bytes(), bytearray()
 
-        next_packet_rel_idx = sensor_response[packet_start_idx+3:].find(preamble)
-        next_packet_start_idx = packet_start_idx + 3 + next_packet_rel_idx
+        # search from the index instead of slicing the tail, so the buffer is not copied for the search
+        next_packet_start_idx = sensor_response.find(preamble, packet_start_idx + 3)
 
         if next_packet_start_idx == -1:
             # preamble of next packet not found, exit
-            return bytes(), bytes()
+            return bytes(), bytearray()
 
         # complete packet found in data
         packet = sensor_response[packet_start_idx:next_packet_start_idx]
         remainder = sensor_response[next_packet_start_idx:]
         return packet, remainder
 
+    def get_packet_length(self, packet_type: int) -> int:
+        has_data, is_batch, batch_length, _, _ = self.get_packet_type(packet_type)
+        if not has_data:
+            return 7
+        return 7 + 4 * (batch_length if is_batch else 1)
+
+    def find_complete_packet(self, sensor_response: bytes) -> Tuple[bytes, bytes]:
+        preamble = self.get_preamble()
+        packet_start_idx = sensor_response.find(preamble)
+
+        if packet_start_idx == -1:
+            # preamble not found, keep the last bytes as they might be the beginning of the next preamble
+            return bytes(), sensor_response[-2:]
+
+        if len(sensor_response) < packet_start_idx + 5:
+            # packet type is not received yet
+            return bytes(), sensor_response[packet_start_idx:]
+
+        packet_end_idx = packet_start_idx + self.get_packet_length(sensor_response[packet_start_idx + 3])
+        if len(sensor_response) < packet_end_idx:
+            # packet is not completely received yet, keep it in the buffer
+            return bytes(), sensor_response[packet_start_idx:]
+
+        packet = sensor_response[packet_start_idx:packet_end_idx]
+        remainder = sensor_response[packet_end_idx:]
+        return packet, remainder
+
     def find_response(self, reg_addr: int, hidden: bool = False, expected_length: int = 7) -> Tuple[bool, bytes]:
         while len(self.buffer) > 0:
-            packet, self.buffer = self.find_packet(self.buffer)
+            # packets are cut by their length, a reply is found without waiting for the preamble of a next packet
+            packet, self.buffer = self.find_complete_packet(self.buffer)
             if len(packet) < 7:
                 return False, bytes()
-            logging.debug(f"{packet}")
-            logging.debug(f"addr: {packet[4]}")
+            if not self.verify_checksum(packet):
+                # preamble was found inside of other data, continue search right after it
+                self.buffer = packet[3:] + self.buffer
+                continue
+            logging.debug("%s", packet)
+            logging.debug("addr: %d", packet[4])
             packet_type = packet[3]
             is_packet_hidden = bool((packet_type >> 1) & 0x01)
             response_addr = packet[4]
-            if response_addr == reg_addr and hidden == is_packet_hidden and len(packet) == expected_length:
+            command_failed = bool(packet_type & 0x01)
+            if response_addr == reg_addr and hidden == is_packet_hidden and \
+                    (len(packet) == expected_length or command_failed):
                 # required packet found
                 return True, packet
         else:
             return False, bytes()
 
     def verify_checksum(self, packet: bytes) -> bool:
-        computed_checksum = 0
-        for byte in packet[:-2]:
-            computed_checksum += byte
-        received_checksum = int.from_bytes(packet[-2:], byteorder='big', signed=False)
+        # copying the packet body into a slice and summing it is cheaper than iterating a memoryview of it
+        computed_checksum = sum(packet[:-2])
+        received_checksum = _CHECKSUM_STRUCT.unpack_from(packet, len(packet) - 2)[0]
         return computed_checksum == received_checksum
 
-    def get_payload(self, packet: bytes) -> Tuple[bool, bytes]:
+    def get_payload(self, packet: bytes) -> memoryview:
         ok = self.verify_checksum(packet)
         if not ok:
             raise RslException("Packet checksum INVALID!")
-        return True, packet[5:-2]
+        # view on the payload, register getters unpack directly from it; the packet is cut from the bytearray
+        # buffer, it is frozen to bytes so payloads kept in the register cache cannot be modified by callers
+        return memoryview(bytes(packet))[5:-2]
 
     def check_packet(self, packet: bytes) -> bool:
-        packet_type = packet[3]
-        has_data = bool((packet_type >> 7) & 0x01)
-        is_batch = bool((packet_type >> 6) & 0x01)
-        data_len = (packet_type >> 2) & 0x0F
-        hidden = bool((packet_type >> 1) & 0x01)
-        error = packet_type & 0x01
+        if len(packet) == _CHECKED_PACKET_LENGTHS[packet[3]]:
+            # valid packets pass with one table lookup, the type bits are decoded only to report an error
+            return True
+        has_data, is_batch, data_len, hidden, error = _PACKET_TYPES[packet[3]]
         if error:
             logging.error(f"Error bit set for packet: {packet}!")
             return False
@@ -232,63 +309,190 @@ class UM7Serial(UM7Registers):
         elif has_data and data_len > 0 and len(packet) != 7 + 4 * data_len:
             logging.error(f"Batch packet with data_len {data_len} shall be {7 + 4 * data_len} bytes, got {len(packet)}")
             return False
-        else:
-            # all the checks pass then
-            return True
-
-    def read_register(self, reg_addr: int, hidden: bool = False) -> Tuple[bool, bytes]:
-        packet_type = self.construct_packet_type(hidden=hidden)
+        return True
+
+    def read_register(self, reg_addr: int, hidden: bool = False) -> memoryview:
+        # registers read moments ago, e.g. as a part of a batch, are served without a new request
+        cached = self.register_cache.get(reg_addr, hidden)
+        if cached is not None:
+            return cached
+        payload = self.read_response(self.read_packets[reg_addr, hidden], reg_addr, hidden, 11)
+        self.register_cache.put(reg_addr, payload, hidden)
+        return payload
+
+    def read_consecutive_registers(self, reg_addr: int, num_registers: int, hidden: bool = False) -> memoryview:
+        if num_registers > 15:
+            # batch packets carry at most 15 registers, split longer reads into several batches
+            payload = bytearray()
+            for batch_addr in range(reg_addr, reg_addr + num_registers, 15):
+                batch_length = min(15, reg_addr + num_registers - batch_addr)
+                payload += self.read_consecutive_registers(batch_addr, batch_length, hidden)
+            return memoryview(bytes(payload))
+        packet_type = self.construct_packet_type(is_batch=True, data_length=num_registers, hidden=hidden)
         packet_to_send = self.construct_packet(packet_type, reg_addr)
-        logging.debug(f"packet sent: {packet_to_send}")
+        payload = self.read_response(packet_to_send, reg_addr, hidden, 7 + 4 * num_registers)
+        self.register_cache.put(reg_addr, payload, hidden)
+        return payload
+
+    def read_response(self, packet_to_send: bytes, reg_addr: int, hidden: bool, expected_length: int) -> memoryview:
+        logging.debug("packet sent: %s", packet_to_send)
+        deadline = monotonic() + 0.2
+        # the request is sent once, a reply arriving in pieces is collected until it is complete;
+        # the request is only repeated when no reply arrived within the resend timeout
+        resend_deadline = min(monotonic() + 0.05, deadline)
+        if not self.send(packet_to_send):
+            raise RslException("Sending packet failed!")
+        while True:
+            self.recv(resend_deadline)
+            ok, sensor_reply = self.find_response(reg_addr, hidden, expected_length)
+            if ok:
+                logging.debug("packet: %s", sensor_reply)
+                if not self.check_packet(sensor_reply):
+                    raise RegisterReadError(f"Invalid response received for register with addr: {reg_addr}!")
+                return self.get_payload(sensor_reply)
+            now = monotonic()
+            if now >= deadline:
+                raise RegisterReadError(f"No response received for register with addr: {reg_addr}!")
+            if now >= resend_deadline:
+                logging.debug("packet re-sent: %s", packet_to_send)
+                self.send(packet_to_send)
+                resend_deadline = min(now + 0.05, deadline)
+
+    def read_many(self, reg_addrs: List[int], hidden: bool = False) -> Dict[int, memoryview]:
+        # coalesce adjacent addresses into batch reads of at most 15 registers
+        batches = []
+        for reg_addr in sorted(set(reg_addrs)):
+            if len(batches) > 0 and reg_addr == batches[-1][0] + batches[-1][1] and batches[-1][1] < 15:
+                batches[-1][1] += 1
+            else:
+                batches.append([reg_addr, 1])
+        requests = {}
+        for start_addr, num_registers in batches:
+            is_batch = num_registers > 1
+            packet_type = self.construct_packet_type(is_batch=is_batch, data_length=num_registers if is_batch else 0,
+                                                     hidden=hidden)
+            requests[start_addr] = num_registers, self.construct_packet(packet_type, start_addr)
+        # all requests are sent back-to-back, responses are matched to requests by their start address
+        registers = {}
+        deadline = monotonic() + 0.2
+        while len(requests) > 0:
+            self.send(b''.join(packet for _, packet in requests.values()))
+            expected_bytes = sum(7 + 4 * num_registers for num_registers, _ in requests.values())
+            received_bytes = 0
+            # wait until the replies for all sent requests had time to arrive, only then ask again for missing ones
+            while len(requests) > 0 and received_bytes < expected_bytes:
+                recv_ok, _ = self.recv(deadline)
+                packet, self.buffer = self.find_complete_packet(self.buffer)
+                while len(packet) > 0:
+                    received_bytes += len(packet)
+                    if not self.verify_checksum(packet):
+                        # preamble was found inside of other data, continue search right after it
+                        packet, self.buffer = self.find_complete_packet(packet[3:] + self.buffer)
+                        continue
+                    start_addr = packet[4]
+                    is_packet_hidden = bool((packet[3] >> 1) & 0x01)
+                    if start_addr in requests and is_packet_hidden == hidden:
+                        num_registers, _ = requests[start_addr]
+                        if packet[3] & 0x01:
+                            raise RegisterReadError(f"Error reply received for register with addr: {start_addr}!")
+                        if len(packet) == 7 + 4 * num_registers:
+                            payload = memoryview(bytes(packet))[5:-2]
+                            for idx in range(num_registers):
+                                registers[start_addr + idx] = payload[4 * idx:4 * idx + 4]
+                            self.register_cache.put(start_addr, payload, hidden)
+                            del requests[start_addr]
+                    packet, self.buffer = self.find_complete_packet(self.buffer)
+                if len(requests) > 0 and (not recv_ok or monotonic() >= deadline):
+                    raise RegisterReadError(f"No response received for registers with addr: {list(requests)}!")
+        return registers
+
+    def get_async_lock(self) -> asyncio.Lock:
+        if self.async_lock is None:
+            self.async_lock = asyncio.Lock()
+        return self.async_lock
+
+    async def read_register_async(self, reg_addr: int, hidden: bool = False) -> memoryview:
+        # blocking serial I/O runs in the default executor, the event loop serves other tasks while the UART is busy
+        async with self.get_async_lock():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.read_register, reg_addr, hidden)
+
+    async def read_many_async(self, reg_addrs: List[int], hidden: bool = False) -> Dict[int, memoryview]:
+        # calls share one port and one receive buffer, the lock lets gathered reads run one after another
+        async with self.get_async_lock():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.read_many, reg_addrs, hidden)
+
+    def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], hidden: bool = False) -> bool:
+        encode = _REGISTER_ENCODERS.get(type(reg_value))
+        if encode is None:
+            raise RslException(f"Unsupported value type for register with addr: {reg_addr}: {type(reg_value)}!")
+        payload = encode(reg_value)
+        self.register_cache.invalidate(reg_addr, hidden=hidden)
+        # checksum of the constant header is precomputed, only the payload bytes are added
+        write_header, header_checksum = self.write_headers[reg_addr, hidden]
+        checksum = _CHECKSUM_STRUCT.pack(header_checksum + sum(payload))
+        packet_to_send = write_header + payload + checksum
+        logging.debug("packet sent: %s", packet_to_send)
         self.send_recv(packet_to_send)
-        t = monotonic()
-        ok, sensor_reply = self.find_response(reg_addr, hidden, 11)
+        ok, sensor_reply = self.find_response(reg_addr)
         if ok:
-            logging.debug(f"packet: {sensor_reply}")
+            logging.debug("packet: %s", sensor_reply)
             self.check_packet(sensor_reply)
-            ok, payload = self.get_payload(sensor_reply)
-            return ok, payload
-        else:
-            while monotonic() - t < 0.2:
-                # try to send <-> receive packets for a pre-defined time out time
-                self.send_recv(packet_to_send)
-                ok, sensor_reply = self.find_response(reg_addr, hidden, 11)
-                if ok:
-                    logging.debug(f"packet: {sensor_reply}")
-                    self.check_packet(sensor_reply)
-                    ok, payload = self.get_payload(sensor_reply)
-                    return ok, payload
-            return False, bytes()
+            self.get_payload(sensor_reply)
+            return True
+        return False
 
-    def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], hidden: bool = False) -> bool:
-        packet_type = self.construct_packet_type(has_data=True, hidden=hidden)
-        if type(reg_value) == int:
-            payload = int.to_bytes(reg_value, byteorder='big', length=4)
-        elif type(reg_value) == bytes:
-            payload = reg_value
-        elif type(reg_value) == float:
-            payload = struct.pack('>f', reg_value)
+    def write_consecutive_registers(self, reg_addr: int, payload: bytes, hidden: bool = False) -> bool:
+        self.register_cache.invalidate(reg_addr, len(payload) // 4, hidden)
+        packet_type = self.construct_packet_type(has_data=True, is_batch=True, data_length=len(payload) // 4,
+                                                 hidden=hidden)
         packet_to_send = self.construct_packet(packet_type, reg_addr, payload)
-        logging.debug(f"packet sent: {packet_to_send}")
+        logging.debug("packet sent: %s", packet_to_send)
         self.send_recv(packet_to_send)
         ok, sensor_reply = self.find_response(reg_addr)
         if ok:
-            logging.debug(f"packet: {sensor_reply}")
+            logging.debug("packet: %s", sensor_reply)
             self.check_packet(sensor_reply)
-            ok, payload = self.get_payload(sensor_reply)
-            return ok
+            return True
+        return False
+
+    @staticmethod
+    def valid_data_packet_types(packet_length: int) -> frozenset:
+        # packet type bytes which pass `check_packet` for a data packet of the given length, so a broadcast of known
+        # length is validated with one set lookup instead of decoding all packet type bits
+        return frozenset(packet_type for packet_type in range(0x80, 0x100)
+                         if _CHECKED_PACKET_LENGTHS[packet_type] == packet_length)
+
+    def pop_buffered_packets(self):
+        # packets are cut from the front of the buffer in place, deleting a bytearray prefix does not copy the rest
+        # of the buffer, as re-assigning the remainder after every packet did
+        preamble = self.get_preamble()
+        while True:
+            packet_start_idx = self.buffer.find(preamble)
+            if packet_start_idx == -1:
+                # keep the last bytes as they might be the beginning of the next preamble
+                del self.buffer[:-2]
+                return
+            next_packet_start_idx = self.buffer.find(preamble, packet_start_idx + 3)
+            if next_packet_start_idx == -1:
+                # the end of the last packet is known when the next preamble arrives, keep it for the next read
+                del self.buffer[:packet_start_idx]
+                return
+            packet = self.buffer[packet_start_idx:next_packet_start_idx]
+            del self.buffer[:next_packet_start_idx]
+            yield packet
 
     def recv_broadcast_packet(self, packet_target_addr: int, expected_packet_length: int,
                               decode_callback: Callable, num_packets: int = -1, flush_buffer_on_start: bool = False):
+        valid_packet_types = self.valid_data_packet_types(expected_packet_length)
         received_packets = 0
         if flush_buffer_on_start:
             self.port.reset_input_buffer()
-            self.buffer = bytes()
+            self.buffer = bytearray()
         while num_packets == -1 or received_packets < num_packets:
             ok, _ = self.recv()
-            while len(self.buffer) > 0:
-                packet, self.buffer = self.find_packet(self.buffer)
-                # logging.info(f"buffer length: {len(self.buffer)}")
+            for packet in self.pop_buffered_packets():
                 if len(packet) > 7:
                     recv_packet_addr = packet[4]
                     if recv_packet_addr == packet_target_addr:
@@ -299,7 +503,7 @@ class UM7Serial(UM7Registers):
                         checksum_ok = self.verify_checksum(packet)
                         if not checksum_ok:
                             logging.error(f"Checksum failed for broadcast packet with addr: {packet_target_addr}")
-                        packet_type_check_ok = self.check_packet(packet)
+                        packet_type_check_ok = packet[3] in valid_packet_types
                         if not packet_type_check_ok:
                             logging.error(f"Checking packet type failed for broadcast with addr: {packet_target_addr}!")
                         if packet_correct_length and checksum_ok and packet_type_check_ok:
@@ -372,196 +576,126 @@ class UM7Serial(UM7Registers):
         return self.recv_broadcast_packet(proc_mag_1_addr, broadcast_packet_length,
                                           self.decode_proc_mag_broadcast, num_packets, flush_buffer_on_start)
 
+    def broadcast_decoders(self) -> Dict[int, Dict[int, Tuple[str, Callable, frozenset]]]:
+        # broadcast start address -> packet length -> (name for logging, decoder, valid packet types), e.g. all
+        # processed data and processed gyro data start at the same address and are told apart by their length
+        def addr(reg_name: str) -> int:
+            return self.svd_parser.find_register_by(name=reg_name).address
+        decoders = {
+            addr('DREG_HEALTH'): {11: ('HEALTH', self.decode_health_broadcast)},
+            addr('DREG_EULER_PHI_THETA'): {27: ('EULER', self.decode_euler_broadcast)},
+            addr('DREG_GYRO_PROC_X'): {55: ('ALL_PROC', self.decode_all_proc_broadcast),
+                                       23: ('GYRO_PROC', self.decode_proc_gyro_broadcast)},
+            addr('DREG_ACCEL_PROC_X'): {23: ('ACCEL_PROC', self.decode_proc_accel_broadcast)},
+            addr('DREG_MAG_PROC_X'): {23: ('MAG_PROC', self.decode_proc_mag_broadcast)},
+            addr('DREG_GYRO_RAW_XY'): {51: ('ALL_RAW', self.decode_all_raw_broadcast),
+                                       19: ('GYRO_RAW', self.decode_raw_gyro_broadcast)},
+            addr('DREG_ACCEL_RAW_XY'): {19: ('ACCEL_RAW', self.decode_raw_accel_broadcast)},
+            addr('DREG_MAG_RAW_XY'): {23: ('MAG_RAW', self.decode_raw_mag_broadcast)},
+            addr('DREG_QUAT_AB'): {19: ('QUAT', self.decode_quaternion_broadcast)},
+            addr('DREG_GYRO_BIAS_X'): {19: ('GYRO_1_BIAS', self.decode_gyro_bias_broadcast)},
+        }
+        return {packet_addr: {length: (name, decode, self.valid_data_packet_types(length))
+                              for length, (name, decode) in decoders_by_length.items()}
+                for packet_addr, decoders_by_length in decoders.items()}
+
     def recv_broadcast(self,  num_packets: int = -1, flush_buffer_on_start: bool = False):
+        # decoders do not depend on received data, look them up once and not for every packet
+        decoders = self.broadcast_decoders()
         received_packets = 0
         if flush_buffer_on_start:
             self.port.reset_input_buffer()
-            self.buffer = bytes()
+            self.buffer = bytearray()
         while num_packets == -1 or received_packets < num_packets:
             ok, _ = self.recv()
-            while len(self.buffer) > 0:
-                packet, self.buffer = self.find_packet(self.buffer)
+            for packet in self.pop_buffered_packets():
                 if len(packet) > 7:
                     packet_addr = packet[4]
-                    start_reg = self.svd_parser.find_register_by(address=packet_addr)
                     checksum_ok = self.verify_checksum(packet)
                     if not checksum_ok:
+                        start_reg = self.svd_parser.find_register_by(address=packet_addr)
                         logging.error(f"Checksum failed for broadcast packet with start_reg: {start_reg}")
-                    packet_type_check_ok = self.check_packet(packet)
-                    if not packet_type_check_ok:
-                        logging.error(f"Checking packet type failed for broadcast with start_reg: {start_reg}!")
-                    health_start_addr = self.svd_parser.find_register_by(name='DREG_HEALTH').address
-                    euler_start_addr = self.svd_parser.find_register_by(name='DREG_EULER_PHI_THETA').address
-                    all_proc_start_addr = self.svd_parser.find_register_by(name='DREG_GYRO_PROC_X').address
-                    accel_proc_start_addr = self.svd_parser.find_register_by(name='DREG_ACCEL_PROC_X').address
-                    mag_proc_start_addr = self.svd_parser.find_register_by(name='DREG_MAG_PROC_X').address
-                    all_raw_start_addr = self.svd_parser.find_register_by(name='DREG_GYRO_RAW_XY').address
-                    accel_raw_start_addr = self.svd_parser.find_register_by(name='DREG_ACCEL_RAW_XY').address
-                    mag_raw_start_addr = self.svd_parser.find_register_by(name='DREG_MAG_RAW_XY').address
-                    gyro_bias_start_addr = self.svd_parser.find_register_by(name='DREG_GYRO_BIAS_X').address
-                    quat_addr = self.svd_parser.find_register_by(name='DREG_QUAT_AB').address
-
-                    if packet_addr == health_start_addr:
-                        if len(packet) == 11:
-                            logging.info("[HEALTH]: broadcast packet found!")
-                            yield self.decode_health_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[HEALTH]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == euler_start_addr:
-                        if len(packet) == 27:
-                            logging.info("[EULER]: broadcast packet found!")
-                            yield self.decode_euler_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[EULER]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == all_proc_start_addr:
-                        if len(packet) == 55:
-                            logging.info("[ALL_PROC]: broadcast packet found!")
-                            yield self.decode_all_proc_broadcast(packet)
-                            received_packets += 1
-                        elif len(packet) == 23:
-                            logging.info("[GYRO_PROC]: broadcast packet found!")
-                            yield self.decode_proc_gyro_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[GYRO_PROC]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == accel_proc_start_addr:
-                        if len(packet) == 23:
-                            logging.info("[ACCEL_PROC]: broadcast packet found!")
-                            yield self.decode_proc_accel_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[ACCEL_PROC]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == mag_proc_start_addr:
-                        if len(packet) == 23:
-                            logging.info("[MAG_PROC]: broadcast packet found!")
-                            yield self.decode_proc_mag_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[MAG_PROC]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == all_raw_start_addr:
-                        if len(packet) == 51:
-                            logging.info("[ALL_RAW]: broadcast packet found!")
-                            yield self.decode_all_raw_broadcast(packet)
-                            received_packets += 1
-                        elif len(packet) == 19:
-                            logging.info("[GYRO_RAW]: broadcast packet found!")
-                            yield self.decode_raw_gyro_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[GYRO_RAW]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == accel_raw_start_addr:
-                        if len(packet) == 19:
-                            logging.info("[ACCEL_RAW]: broadcast packet found!")
-                            yield self.decode_raw_accel_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[ACCEL_RAW]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == mag_raw_start_addr:
-                        if len(packet) == 23:
-                            logging.info("[MAG_RAW]: broadcast packet found!")
-                            yield self.decode_raw_mag_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[MAG_RAW]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == quat_addr:
-                        if len(packet) == 19:
-                            logging.info("[QUAT]: quaternion broadcast packet found!")
-                            yield self.decode_quaternion_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[QUAT]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    elif packet_addr == gyro_bias_start_addr:
-                        if len(packet) == 19:
-                            logging.info("[GYRO_1_BIAS]: broadcast packet found!")
-                            yield self.decode_gyro_bias_broadcast(packet)
-                            received_packets += 1
-                        else:
-                            logging.error(f"[GYRO_1_BIAS]: invalid packet length, got {len(packet)}, packet: {packet}!")
-                    else:
+                        continue
+                    decoders_by_length = decoders.get(packet_addr)
+                    if decoders_by_length is None:
+                        start_reg = self.svd_parser.find_register_by(address=packet_addr)
                         logging.error(f"[BROADCAST ERROR]: packet with addr {packet_addr}, reg: {start_reg.name} found "
                                       f"of length: {len(packet)} bytes, "
                                       f"no decoding is implemented for this!! Packet: {packet}")
+                        continue
+                    decoder = decoders_by_length.get(len(packet))
+                    if decoder is None:
+                        names = '/'.join(name for name, _, _ in decoders_by_length.values())
+                        logging.error(f"[{names}]: invalid packet length, got {len(packet)}, packet: {packet}!")
+                        continue
+                    name, decode, valid_packet_types = decoder
+                    if packet[3] not in valid_packet_types:
+                        logging.error(f"[{name}]: checking packet type failed, packet: {packet}!")
+                        continue
+                    logging.info("[%s]: broadcast packet found!", name)
+                    yield decode(packet)
+                    received_packets += 1
 
     def decode_all_raw_broadcast(self, packet) -> UM7AllRawPacket:
-        payload = packet[5:-2]
-        g_x, g_y, g_z, g_time = struct.unpack('>hhh2xf', payload[0:12])
-        a_x, a_y, a_z, a_time = struct.unpack('>hhh2xf', payload[12:24])
-        m_x, m_y, m_z, m_time = struct.unpack('>hhh2xf',   payload[24:36])
-        T, T_t = struct.unpack('>ff', payload[36:44])
+        g_x, g_y, g_z, g_time, a_x, a_y, a_z, a_time, m_x, m_y, m_z, m_time, T, T_t = \
+            _ALL_RAW_STRUCT.unpack_from(packet, 5)
         return UM7AllRawPacket(gyro_raw_x=g_x, gyro_raw_y=g_y, gyro_raw_z=g_z, gyro_raw_time=g_time,
                                accel_raw_x=a_x, accel_raw_y=a_y, accel_raw_z=a_z, accel_raw_time=a_time,
                                mag_raw_x=m_x, mag_raw_y=m_y, mag_raw_z=m_z, mag_raw_time=m_time,
                                temperature=T, temperature_time=T_t)
 
     def decode_all_proc_broadcast(self, packet) -> UM7AllProcPacket:
-        payload = packet[5:-2]
-        g_x, g_y, g_z, g_time = struct.unpack('>ffff', payload[0:16])
-        a_x, a_y, a_z, a_time = struct.unpack('>ffff', payload[16:32])
-        m_x, m_y, m_z, m_time = struct.unpack('>ffff', payload[32:48])
+        g_x, g_y, g_z, g_time, a_x, a_y, a_z, a_time, m_x, m_y, m_z, m_time = _ALL_PROC_STRUCT.unpack_from(packet, 5)
         return UM7AllProcPacket(gyro_proc_x=g_x, gyro_proc_y=g_y, gyro_proc_z=g_z, gyro_proc_time=g_time,
                                 accel_proc_x=a_x, accel_proc_y=a_y, accel_proc_z=a_z, accel_proc_time=a_time,
                                 mag_proc_x=m_x, mag_proc_y=m_y, mag_proc_z=m_z, mag_proc_time=m_time)
 
     def decode_euler_broadcast(self, packet) -> UM7EulerPacket:
-        payload = packet[5:-2]
-        roll, pitch, yaw = struct.unpack('>hhh2x', payload[0:8])
-        roll_rate, pitch_rate, yaw_rate, time_stamp = struct.unpack('>hhh2xf', payload[8:20])
+        roll, pitch, yaw, roll_rate, pitch_rate, yaw_rate, time_stamp = _EULER_STRUCT.unpack_from(packet, 5)
         return UM7EulerPacket(
-            roll=roll/91.02222, pitch=pitch/91.02222, yaw=yaw/91.02222,
-            roll_rate=roll_rate/91.02222, pitch_rate=pitch_rate/91.02222, yaw_rate=yaw_rate/91.02222,
-            time_stamp=time_stamp
+            roll=roll * _EULER_SCALE, pitch=pitch * _EULER_SCALE, yaw=yaw * _EULER_SCALE,
+            roll_rate=roll_rate * _EULER_RATE_SCALE, pitch_rate=pitch_rate * _EULER_RATE_SCALE,
+            yaw_rate=yaw_rate * _EULER_RATE_SCALE, time_stamp=time_stamp
         )
 
     def decode_quaternion_broadcast(self, packet) -> UM7QuaternionPacket:
-        payload = packet[5:-2]
-        q_w, q_x, q_y, q_z, q_time = struct.unpack('>hhh2xf', payload[0:12])
+        q_w, q_x, q_y, q_z, q_time = _QUAT_STRUCT.unpack_from(packet, 5)
         return UM7QuaternionPacket(
-            q_w=q_w/29789.09091, q_x=q_x/29789.09091, q_y=q_y/29789.09091, q_z=q_z/29789.09091, q_time=q_time
+            q_w=q_w * _QUAT_SCALE, q_x=q_x * _QUAT_SCALE, q_y=q_y * _QUAT_SCALE, q_z=q_z * _QUAT_SCALE, q_time=q_time
         )
 
     def decode_raw_accel_broadcast(self, packet) -> UM7RawAccelPacket:
-        payload = packet[5:-2]
-        a_x, a_y, a_z, a_time = struct.unpack('>hhh2xf', payload[0:12])
+        a_x, a_y, a_z, a_time = _RAW_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7RawAccelPacket(accel_raw_x=a_x, accel_raw_y=a_y, accel_raw_z=a_z, accel_raw_time=a_time)
 
     def decode_raw_gyro_broadcast(self, packet) -> UM7RawGyroPacket:
-        payload = packet[5:-2]
-        g_x, g_y, g_z, g_time = struct.unpack('>hhh2xf', payload[0:12])
+        g_x, g_y, g_z, g_time = _RAW_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7RawGyroPacket(gyro_raw_x=g_x, gyro_raw_y=g_y, gyro_raw_z=g_z, gyro_raw_time=g_time)
 
     def decode_raw_mag_broadcast(self, packet) -> UM7RawMagPacket:
-        payload = packet[5:-2]
-        m_x, m_y, m_z, m_time = struct.unpack('>hhh2xf', payload[0:12])
+        m_x, m_y, m_z, m_time = _RAW_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7RawMagPacket(mag_raw_x=m_x, mag_raw_y=m_y, mag_raw_z=m_z, mag_raw_time=m_time)
 
     def decode_proc_accel_broadcast(self, packet) -> UM7ProcAccelPacket:
-        payload = packet[5:-2]
-        a_x, a_y, a_z, a_time = struct.unpack('>ffff', payload[0:16])
+        a_x, a_y, a_z, a_time = _PROC_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7ProcAccelPacket(accel_proc_x=a_x, accel_proc_y=a_y, accel_proc_z=a_z, accel_proc_time=a_time)
 
     def decode_proc_gyro_broadcast(self, packet) -> UM7ProcGyroPacket:
-        payload = packet[5:-2]
-        g_x, g_y, g_z, g_time = struct.unpack('>ffff', payload[0:16])
+        g_x, g_y, g_z, g_time = _PROC_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7ProcGyroPacket(gyro_proc_x=g_x, gyro_proc_y=g_y, gyro_proc_z=g_z, gyro_proc_time=g_time)
 
     def decode_proc_mag_broadcast(self, packet) -> UM7ProcMagPacket:
-        payload = packet[5:-2]
-        m_x, m_y, m_z, m_time = struct.unpack('>ffff', payload[0:16])
+        m_x, m_y, m_z, m_time = _PROC_VECTOR_STRUCT.unpack_from(packet, 5)
         return UM7ProcMagPacket(mag_proc_x=m_x, mag_proc_y=m_y, mag_proc_z=m_z, mag_proc_time=m_time)
 
     def decode_gyro_bias_broadcast(self, packet) -> UM7GyroBiasPacket:
-        payload = packet[5:-2]
-        gyro_bias_x, gyro_bias_y, gyro_bias_z, = struct.unpack('>fff', payload[0:12])
+        gyro_bias_x, gyro_bias_y, gyro_bias_z = _GYRO_BIAS_STRUCT.unpack_from(packet, 5)
         return UM7GyroBiasPacket(gyro_bias_x=gyro_bias_x, gyro_bias_y=gyro_bias_y, gyro_bias_z=gyro_bias_z)
 
     def decode_health_broadcast(self, packet) -> UM7HealthPacket:
-        payload = packet[5:-2]
-        health, = struct.unpack('>I', payload[0:4])
+        health, = _HEALTH_STRUCT.unpack_from(packet, 5)
         return UM7HealthPacket(health=health)
 
-
 if __name__ == '__main__':
     pass
     um7 = UM7Serial()
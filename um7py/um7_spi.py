@@ -4,6 +4,8 @@
 # Version: v0.1
 # License: MIT
 
+import sys
+
 from um7py.rsl_spi import RslSpiUsbIss, RslSpiLinuxPort
 from um7py.um7_registers import UM7Registers
 
@@ -20,11 +22,15 @@ class UM7SpiUsbIss(RslSpiUsbIss, UM7Registers):
 
 if __name__ == '__main__':
     um7_spi_iss = UM7SpiUsbIss()
-    print(f"creg_com_settings             : {um7_spi_iss.creg_com_settings}")
-    print(f"creg_com_rates1               : {um7_spi_iss.creg_com_rates1}")
-    print(f"creg_com_rates2               : {um7_spi_iss.creg_com_rates2}")
-    print(f"creg_com_rates3               : {um7_spi_iss.creg_com_rates3}")
-    print(f"creg_com_rates4               : {um7_spi_iss.creg_com_rates4}")
-    print(f"creg_com_rates5               : {um7_spi_iss.creg_com_rates5}")
-    print(f"creg_com_rates6               : {um7_spi_iss.creg_com_rates6}")
-    print(f"creg_com_rates7               : {um7_spi_iss.creg_com_rates7}")
+    # all eight communication registers are fetched with one SPI transfer and decoded with one unpack
+    creg_com = um7_spi_iss.read_creg_com_block()
+    sys.stdout.write('\n'.join([
+        f"creg_com_settings             : {creg_com.settings:#010x}",
+        f"creg_com_rates1               : {creg_com.rates1:#010x}",
+        f"creg_com_rates2               : {creg_com.rates2:#010x}",
+        f"creg_com_rates3               : {creg_com.rates3:#010x}",
+        f"creg_com_rates4               : {creg_com.rates4:#010x}",
+        f"creg_com_rates5               : {creg_com.rates5:#010x}",
+        f"creg_com_rates6               : {creg_com.rates6:#010x}",
+        f"creg_com_rates7               : {creg_com.rates7:#010x}",
+    ]) + '\n')